@@ -4,23 +4,111 @@ Management command to load CSV data into the database.
 Loads places, items, orders, and order_items from CSV files.
 """
 
+import codecs
+import io
+import json
 import os
-import csv
-import sys
-from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
 from decimal import Decimal, InvalidOperation
+from functools import lru_cache
 
+import numpy as np
+import pandas as pd
 from django.core.management.base import BaseCommand
 from django.conf import settings
-from django.db import transaction
+from django.db import connection, connections, transaction
+from django.db.models import JSONField
+from django.db.models.base import ModelState
 from django.utils import timezone
 
-# Increase CSV field size limit
-csv.field_size_limit(sys.maxsize)
+try:
+    # Optional: multi-threaded C CSV parser used by read_chunks
+    import pyarrow as pa
+    from pyarrow import csv as pa_csv
+except ImportError:
+    pa = pa_csv = None
+
+try:
+    # Optional: streams inserts through COPY FROM STDIN on PostgreSQL
+    from django_bulk_load import bulk_insert_models
+except ImportError:
+    bulk_insert_models = None
+
+_EMPTY = frozenset({'', 'None'})
+
+
+def safe_decimal(value, default=Decimal('0'), _Decimal=Decimal, _empty=_EMPTY):
+    """Convert a CSV cell to Decimal safely."""
+    if value is None or value in _empty:
+        return default
+    try:
+        return _Decimal(value)
+    except (InvalidOperation, ValueError, TypeError):
+        return default
+
+
+@lru_cache(maxsize=None)
+def _field_defaults(model_cls):
+    """Split a model's concrete field defaults into static values and callables."""
+    static, dynamic = {}, {}
+    for field in model_cls._meta.concrete_fields:
+        if field.has_default() and callable(field.default):
+            dynamic[field.attname] = field.default
+        else:
+            static[field.attname] = field.get_default()
+    return static, dynamic
+
+
+def _fast_construct(model_cls, **kwargs):
+    """
+    Build a model instance without running Model.__init__.
+
+    Only safe for instances handed straight to bulk_create, which reads
+    field values from __dict__ and never calls save() or signals.
+    """
+    static, dynamic = _field_defaults(model_cls)
+    obj = model_cls.__new__(model_cls)
+    values = static.copy()
+    for attname, default in dynamic.items():
+        if attname not in kwargs:
+            values[attname] = default()
+    values.update(kwargs)
+    obj.__dict__ = values
+    obj._state = ModelState()
+    return obj
+
+
+def _run_loader(name, data_dir, limit, batch_size, use_copy=False):
+    """Run a single load_* method in a worker process with its own DB connection."""
+    import django
+    django.setup()
+    command = Command()
+    command.use_copy = use_copy
+    getattr(command, f'load_{name}')(data_dir, limit, batch_size)
+
+
+def _copy_text(value):
+    """Escape one value for COPY ... FROM STDIN in PostgreSQL's text format."""
+    return (
+        value.replace('\\', '\\\\')
+        .replace('\t', '\\t')
+        .replace('\n', '\\n')
+        .replace('\r', '\\r')
+    )
 
 
 class Command(BaseCommand):
     help = 'Load CSV data files into the database'
+    use_copy = False
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Primary keys per model, shared by the loaders of one run
+        self._known_ids = {}
+        # Integer external_ids per model; rows made by load_data have
+        # auto primary keys, so their external_ids may match a CSV id
+        self._known_external_ids = {}
 
     def add_arguments(self, parser):
         parser.add_argument(
@@ -60,6 +148,21 @@ class Command(BaseCommand):
             default=5000,
             help='Batch size for bulk inserts (default: 5000)'
         )
+        parser.add_argument(
+            '--parallel',
+            action='store_true',
+            help='Load items and orders concurrently in separate processes'
+        )
+        parser.add_argument(
+            '--fast',
+            action='store_true',
+            help='Drop secondary indexes and foreign keys while loading (PostgreSQL only)'
+        )
+        parser.add_argument(
+            '--copy',
+            action='store_true',
+            help='Insert rows with COPY FROM STDIN instead of INSERT (PostgreSQL only)'
+        )
 
     def handle(self, *args, **options):
         data_dir = os.path.join(settings.BASE_DIR, 'data')
@@ -68,17 +171,34 @@ class Command(BaseCommand):
         limit = options['limit']
         batch_size = options['batch_size']
         
-        if load_all or options['places']:
-            self.load_places(data_dir, limit, batch_size)
+        if options['copy'] and connection.vendor != 'postgresql':
+            self.stdout.write(self.style.WARNING('--copy only applies to PostgreSQL; ignoring'))
+        self.use_copy = options['copy']
         
-        if load_all or options['items']:
-            self.load_items(data_dir, limit, batch_size)
+        fast_models = []
+        if options['fast']:
+            from apps.inventory.models import Item
+            from apps.sales.models import Order, OrderItem
+            fast_models = [Item, Order, OrderItem]
         
-        if load_all or options['orders']:
-            self.load_orders(data_dir, limit, batch_size)
+        with self.deferred_indexes(fast_models):
+            if load_all or options['places']:
+                self.load_places(data_dir, limit, batch_size)
         
-        if load_all or options['order_items']:
-            self.load_order_items(data_dir, limit, batch_size)
+            load_items = load_all or options['items']
+            load_orders = load_all or options['orders']
+        
+            if options['parallel'] and load_items and load_orders:
+                self.load_in_parallel(['items', 'orders'], data_dir, limit, batch_size)
+            else:
+                if load_items:
+                    self.load_items(data_dir, limit, batch_size)
+            
+                if load_orders:
+                    self.load_orders(data_dir, limit, batch_size)
+        
+            if load_all or options['order_items']:
+                self.load_order_items(data_dir, limit, batch_size)
         
         if not any([load_all, options['places'], options['items'], 
                     options['orders'], options['order_items']]):
@@ -86,33 +206,334 @@ class Command(BaseCommand):
                 'No data type specified. Use --all or specific flags (--places, --items, --orders, --order-items)'
             ))
 
-    def safe_int(self, value, default=None):
-        """Convert value to int safely."""
-        if value is None or value == '' or value == 'None':
-            return default
-        try:
-            return int(float(value))
-        except (ValueError, TypeError):
-            return default
-
-    def safe_decimal(self, value, default=Decimal('0')):
-        """Convert value to Decimal safely."""
-        if value is None or value == '' or value == 'None':
-            return default
-        try:
-            return Decimal(str(value))
-        except (InvalidOperation, ValueError):
-            return default
-
-    def safe_datetime(self, timestamp, default=None):
-        """Convert Unix timestamp to datetime."""
-        if timestamp is None or timestamp == '' or timestamp == 'None':
-            return default or timezone.now()
+    def load_in_parallel(self, names, data_dir, limit=None, batch_size=5000):
+        """
+        Run independent loaders concurrently, one process each.
+
+        Placeholder places referenced by items and orders are created up
+        front so the workers never insert into the same table.
+        """
+        if connection.vendor == 'sqlite':
+            self.stdout.write(self.style.WARNING(
+                'SQLite does not support concurrent writers; loading sequentially'
+            ))
+            for name in names:
+                getattr(self, f'load_{name}')(data_dir, limit, batch_size)
+            return
+        
+        self.create_referenced_places(data_dir, batch_size)
+        
+        # Forked workers must not share the parent's connection
+        connections.close_all()
+        with ProcessPoolExecutor(max_workers=len(names)) as executor:
+            futures = [
+                executor.submit(_run_loader, name, data_dir, limit, batch_size, self.use_copy)
+                for name in names
+            ]
+            for future in futures:
+                future.result()
+        
+        # The workers inserted rows this process hasn't seen
+        self._known_ids.clear()
+        self._known_external_ids.clear()
+
+    def create_referenced_places(self, data_dir, batch_size=5000):
+        """Create placeholder places for every place id used by items or orders."""
+        from apps.core.models import Place
+        
+        referenced = set()
+        for filename, column in (('dim_items.csv', 'user_id'), ('fct_orders.csv', 'place_id')):
+            filepath = os.path.join(data_dir, filename)
+            if not os.path.exists(filepath):
+                continue
+            for chunk in self.read_chunks(filepath, batch_size, [column]):
+                place_ids = self.to_int(chunk[column])
+                referenced.update(place_ids[place_ids != 0].unique().tolist())
+        
+        missing = np.setdiff1d(
+            np.fromiter(referenced, dtype=np.int64, count=len(referenced)),
+            self.known_ids(Place)
+        )
+        self.create_placeholder_places(missing, batch_size)
+        self.stdout.write(f'  Created {len(missing)} placeholder places')
+
+    def create_placeholder_places(self, place_ids, batch_size=5000):
+        """Bulk-create a placeholder Place for each id in place_ids."""
+        from apps.core.models import Place
+        
+        Place.objects.bulk_create(
+            [
+                _fast_construct(Place, id=place_id, title=f'Place {place_id}', active=True)
+                for place_id in place_ids.tolist()
+            ],
+            ignore_conflicts=True,
+            batch_size=batch_size
+        )
+        self.add_known_ids(Place, place_ids)
+
+    @contextmanager
+    def deferred_indexes(self, models):
+        """
+        Drop secondary indexes and foreign keys on the models' tables while
+        the block runs, then recreate them from their saved definitions.
+
+        Primary keys and unique indexes are kept so conflict handling still
+        works. Only applies to PostgreSQL; elsewhere this is a no-op.
+        """
+        if not models or connection.vendor != 'postgresql':
+            if models:
+                self.stdout.write(self.style.WARNING('--fast only applies to PostgreSQL; ignoring'))
+            yield
+            return
+        
+        qn = connection.ops.quote_name
+        ddl = {}
+        with connection.cursor() as cursor:
+            for model in models:
+                table = model._meta.db_table
+                cursor.execute(
+                    """
+                    SELECT idx.relname, pg_get_indexdef(ix.indexrelid)
+                    FROM pg_index ix JOIN pg_class idx ON idx.oid = ix.indexrelid
+                    WHERE ix.indrelid = %s::regclass
+                      AND NOT ix.indisprimary AND NOT ix.indisunique
+                    """,
+                    [table]
+                )
+                indexes = cursor.fetchall()
+                cursor.execute(
+                    """
+                    SELECT conname, pg_get_constraintdef(oid)
+                    FROM pg_constraint
+                    WHERE conrelid = %s::regclass AND contype = 'f'
+                    """,
+                    [table]
+                )
+                foreign_keys = cursor.fetchall()
+                ddl[model] = {'indexes': indexes, 'foreign_keys': foreign_keys}
+                
+                for name, _ in foreign_keys:
+                    cursor.execute(f'ALTER TABLE {qn(table)} DROP CONSTRAINT {qn(name)}')
+                for name, _ in indexes:
+                    cursor.execute(f'DROP INDEX {qn(name)}')
+                self.stdout.write(
+                    f'  Dropped {len(indexes)} indexes and {len(foreign_keys)} foreign keys on {table}'
+                )
+        
         try:
-            ts = int(float(timestamp))
-            return datetime.fromtimestamp(ts, tz=timezone.get_current_timezone())
-        except (ValueError, TypeError, OSError):
-            return default or timezone.now()
+            yield
+        finally:
+            with connection.cursor() as cursor:
+                # Index builds run outside the loaders' transactions
+                cursor.execute("SET maintenance_work_mem = '1GB'")
+                for model, statements in ddl.items():
+                    table = model._meta.db_table
+                    for _, definition in statements['indexes']:
+                        cursor.execute(definition)
+                    for name, definition in statements['foreign_keys']:
+                        cursor.execute(
+                            f'ALTER TABLE {qn(table)} ADD CONSTRAINT {qn(name)} {definition}'
+                        )
+                    self.stdout.write(f'  Restored indexes and foreign keys on {table}')
+
+    @contextmanager
+    def bulk_transaction(self):
+        """
+        Run a loader inside a single transaction.
+
+        Commits once per file instead of once per batch; on PostgreSQL the
+        session is also tuned for bulk ingest for the duration of the load.
+        """
+        with transaction.atomic():
+            if connection.vendor == 'postgresql':
+                self._tune_session()
+            yield
+
+    def _tune_session(self):
+        """Apply transaction-local PostgreSQL settings that favour bulk inserts."""
+        with connection.cursor() as cursor:
+            cursor.execute("SET LOCAL synchronous_commit = OFF")
+            cursor.execute("SET LOCAL work_mem = '256MB'")
+            cursor.execute("SET LOCAL maintenance_work_mem = '1GB'")
+
+    def read_chunks(self, filepath, batch_size, columns):
+        """
+        Read a CSV file as DataFrame chunks of at most batch_size rows.
+
+        Cells are kept as strings (empty cells become '') so each loader can
+        coerce whole columns at once. Columns missing from the file are
+        added as empty strings, and invalid UTF-8 bytes become U+FFFD.
+        Parses with pyarrow when it is installed, pandas otherwise.
+        """
+        if pa_csv is not None:
+            return self.read_arrow_chunks(filepath, batch_size, columns)
+        return self.read_pandas_chunks(filepath, batch_size, columns)
+
+    def read_pandas_chunks(self, filepath, batch_size, columns):
+        """pandas version of read_chunks."""
+        reader = pd.read_csv(
+            filepath,
+            chunksize=batch_size,
+            dtype=str,
+            keep_default_na=False,
+            usecols=lambda name: name in columns,
+            encoding='utf-8',
+            encoding_errors='replace',
+        )
+        for chunk in reader:
+            yield chunk.reindex(columns=columns, fill_value='')
+
+    def read_arrow_chunks(self, filepath, batch_size, columns):
+        """
+        pyarrow version of read_chunks; parsing runs in C on several threads.
+
+        pyarrow rejects invalid UTF-8, so the file is decoded with
+        errors='replace' on the way in, as pandas' encoding_errors does.
+        """
+        with open(filepath, 'rb') as raw:
+            reader = pa_csv.open_csv(
+                codecs.EncodedFile(raw, 'utf-8', 'utf-8', errors='replace'),
+                parse_options=pa_csv.ParseOptions(newlines_in_values=True),
+                convert_options=pa_csv.ConvertOptions(
+                    column_types={name: pa.string() for name in columns},
+                    include_columns=columns,
+                    include_missing_columns=True,
+                    strings_can_be_null=False,
+                ),
+            )
+            for batch in reader:
+                for start in range(0, batch.num_rows, batch_size):
+                    chunk = batch.slice(start, batch_size).to_pandas()
+                    yield chunk.fillna('')
+
+    def id_array(self, queryset):
+        """
+        Fetch a queryset's primary keys as a sorted int64 array.
+
+        Streams the ids with a server-side cursor and stores them as a typed
+        array, which uses a fraction of the memory of a set of Python ints
+        and works directly with Series.isin.
+        """
+        ids = np.fromiter(
+            queryset.values_list('id', flat=True).iterator(chunk_size=10000),
+            dtype=np.int64
+        )
+        ids.sort()
+        return ids
+
+    def known_ids(self, model):
+        """Primary keys of model, fetched on first use and reused by later loaders."""
+        if model not in self._known_ids:
+            self._known_ids[model] = self.id_array(model.objects.all())
+        return self._known_ids[model]
+
+    def add_known_ids(self, model, ids):
+        """Record newly inserted primary keys of model and return the updated array."""
+        self._known_ids[model] = np.union1d(self.known_ids(model), ids)
+        return self._known_ids[model]
+
+    def known_external_ids(self, model):
+        """
+        external_id values of model that are canonical integers, as a sorted int64 array.
+
+        Loaders set external_id=str(pk), so only these can collide with a
+        row they insert.
+        """
+        if model not in self._known_external_ids:
+            values = pd.Series(list(
+                model.objects.exclude(external_id=None)
+                .values_list('external_id', flat=True).iterator(chunk_size=10000)
+            ), dtype=object)
+            numbers = pd.to_numeric(values, errors='coerce')
+            canonical = numbers.notna()
+            numbers = numbers[canonical].astype('int64')
+            numbers = numbers[numbers.astype(str) == values[canonical]]
+            self._known_external_ids[model] = np.unique(numbers.to_numpy())
+        return self._known_external_ids[model]
+
+    def add_known_external_ids(self, model, ids):
+        """Record newly inserted external_ids of model and return the updated array."""
+        self._known_external_ids[model] = np.union1d(self.known_external_ids(model), ids)
+        return self._known_external_ids[model]
+
+    def first_occurrences(self, ids, keep):
+        """Narrow the keep mask to the first kept row for each id."""
+        return keep & ~ids.where(keep).duplicated()
+
+    def to_int(self, series):
+        """Convert a column to int64; unparseable values become 0."""
+        return pd.to_numeric(series, errors='coerce').fillna(0).astype('int64')
+
+    def to_float(self, series, default=0.0):
+        """Convert a column to float; unparseable values become default."""
+        return pd.to_numeric(series, errors='coerce').fillna(default)
+
+    def truncate(self, series, length, empty=''):
+        """Cut a string column to length; empty cells become `empty`."""
+        series = series.str.slice(0, length)
+        if empty == '':
+            return series
+        return series.where(series != '', empty)
+
+    def to_datetime(self, series):
+        """Convert a column of Unix timestamps to aware datetimes."""
+        seconds = np.trunc(pd.to_numeric(series, errors='coerce'))
+        return pd.to_datetime(seconds, unit='s', utc=True, errors='coerce').fillna(timezone.now())
+
+    def bulk_insert(self, model, objs, batch_size):
+        """
+        Insert model instances that are known not to exist yet.
+
+        Loaders filter out existing and repeated ids, and ids already used
+        as an external_id, before calling this, so no conflict handling is
+        requested and the database can use a plain INSERT. Uses COPY on PostgreSQL when --copy is given, else
+        django-bulk-load when it is installed, and falls back to
+        bulk_create everywhere else.
+        """
+        if self.use_copy and connection.vendor == 'postgresql':
+            self.copy_insert(model, objs)
+        elif bulk_insert_models is not None and connection.vendor == 'postgresql':
+            bulk_insert_models(objs)
+        else:
+            model.objects.bulk_create(objs, batch_size=batch_size)
+
+    def copy_value(self, field, obj):
+        """One field of obj as a COPY text-format value."""
+        # Fills auto_now/auto_now_add, as bulk_create would
+        value = field.pre_save(obj, add=True)
+        if value is None:
+            return '\\N'
+        if isinstance(field, JSONField):
+            text = json.dumps(value, cls=field.encoder)
+        elif isinstance(value, bool):
+            text = 't' if value else 'f'
+        else:
+            text = str(field.get_db_prep_save(value, connection))
+        return _copy_text(text)
+
+    def copy_insert(self, model, objs):
+        """Stream instances into the model's table with COPY FROM STDIN."""
+        if not objs:
+            return
+        qn = connection.ops.quote_name
+        fields = model._meta.concrete_fields
+        column_list = ', '.join(qn(field.column) for field in fields)
+        
+        buffer = io.StringIO()
+        for obj in objs:
+            buffer.write('\t'.join(self.copy_value(field, obj) for field in fields))
+            buffer.write('\n')
+        
+        copy_sql = f'COPY {qn(model._meta.db_table)} ({column_list}) FROM STDIN'
+        with connection.cursor() as cursor:
+            raw = cursor.cursor
+            if hasattr(raw, 'copy'):
+                # psycopg 3
+                with raw.copy(copy_sql) as copy:
+                    copy.write(buffer.getvalue())
+            else:
+                buffer.seek(0)
+                raw.copy_expert(copy_sql, buffer)
 
     def load_places(self, data_dir, limit=None, batch_size=5000):
         """Load places from dim_places.csv."""
@@ -126,51 +547,59 @@ class Command(BaseCommand):
         self.stdout.write(f'Loading places from {filepath}...')
         
         # Get existing place IDs
-        existing_ids = set(Place.objects.values_list('id', flat=True))
+        existing_ids = self.known_ids(Place)
         
-        places_to_create = []
+        columns = [
+            'id', 'title', 'description', 'country', 'currency', 'timezone',
+            'street_address', 'email', 'phone',
+        ]
         count = 0
         skipped = 0
         
-        with open(filepath, 'r', encoding='utf-8', errors='replace') as f:
-            reader = csv.DictReader(f)
-            
-            for row in reader:
-                if limit and count >= limit:
-                    break
-                
-                place_id = self.safe_int(row.get('id'))
-                if not place_id:
-                    skipped += 1
-                    continue
+        with self.bulk_transaction():
+            for chunk in self.read_chunks(filepath, batch_size, columns):
+                ids = self.to_int(chunk['id'])
+                keep = (ids != 0) & ~ids.isin(existing_ids)
+                keep = self.first_occurrences(ids, keep)
+                skipped += int((~keep).sum())
+                chunk = chunk[keep].assign(id=ids[keep])
+                if limit:
+                    chunk = chunk.head(limit - count)
+                # Insert in primary key order to keep B-tree page writes sequential
+                chunk = chunk.sort_values('id', kind='stable')
                 
-                if place_id in existing_ids:
-                    skipped += 1
-                    continue
+                chunk['title'] = self.truncate(chunk['title'], 255)
+                chunk['description'] = self.truncate(chunk['description'], 1000)
+                for column, length in (
+                    ('country', 100), ('currency', 10), ('timezone', 50),
+                    ('street_address', 500), ('email', 254), ('phone', 50),
+                ):
+                    chunk[column] = self.truncate(chunk[column], length, empty=None)
                 
-                place = Place(
-                    id=place_id,
-                    title=row.get('title', f'Place {place_id}')[:255],
-                    description=row.get('description', '')[:1000] if row.get('description') else '',
-                    active=True,
-                    country=row.get('country', '')[:100] if row.get('country') else None,
-                    currency=row.get('currency', '')[:10] if row.get('currency') else None,
-                    timezone=row.get('timezone', '')[:50] if row.get('timezone') else None,
-                    street_address=row.get('street_address', '')[:500] if row.get('street_address') else None,
-                    contact_email=row.get('email', '')[:254] if row.get('email') else None,
-                    contact_phone=row.get('phone', '')[:50] if row.get('phone') else None,
-                )
-                places_to_create.append(place)
-                count += 1
+                places_to_create = [
+                    _fast_construct(
+                        Place,
+                        id=pk,
+                        title=title,
+                        description=description,
+                        active=True,
+                        country=country,
+                        currency=currency,
+                        timezone=tz,
+                        street_address=street_address,
+                        contact_email=email,
+                        contact_phone=phone,
+                    )
+                    for (pk, title, description, country, currency, tz,
+                         street_address, email, phone) in chunk.itertuples(index=False, name=None)
+                ]
+                self.bulk_insert(Place, places_to_create, batch_size)
+                existing_ids = self.add_known_ids(Place, chunk['id'].to_numpy())
+                count += len(places_to_create)
+                self.stdout.write(f'  Created {count} places...')
                 
-                if len(places_to_create) >= batch_size:
-                    Place.objects.bulk_create(places_to_create, ignore_conflicts=True)
-                    self.stdout.write(f'  Created {count} places...')
-                    places_to_create = []
-        
-        # Create remaining
-        if places_to_create:
-            Place.objects.bulk_create(places_to_create, ignore_conflicts=True)
+                if limit and count >= limit:
+                    break
         
         self.stdout.write(self.style.SUCCESS(
             f'Loaded {count} places ({skipped} skipped)'
@@ -189,61 +618,56 @@ class Command(BaseCommand):
         self.stdout.write(f'Loading items from {filepath}...')
         
         # Get existing item IDs and place IDs
-        existing_item_ids = set(Item.objects.values_list('id', flat=True))
-        valid_place_ids = set(Place.objects.values_list('id', flat=True))
+        existing_item_ids = self.known_ids(Item)
+        valid_place_ids = self.known_ids(Place)
         
-        items_to_create = []
+        columns = ['id', 'user_id', 'title', 'description', 'price']
         count = 0
         skipped = 0
         
-        with open(filepath, 'r', encoding='utf-8', errors='replace') as f:
-            reader = csv.DictReader(f)
-            
-            for row in reader:
-                if limit and count >= limit:
-                    break
+        with self.bulk_transaction():
+            for chunk in self.read_chunks(filepath, batch_size, columns):
+                ids = self.to_int(chunk['id'])
+                # Get place_id from user_id (items belong to place via user)
+                place_ids = self.to_int(chunk['user_id'])
+                keep = (ids != 0) & ~ids.isin(existing_item_ids) & (place_ids != 0)
+                keep = self.first_occurrences(ids, keep)
+                skipped += int((~keep).sum())
+                chunk = chunk[keep].assign(id=ids[keep], user_id=place_ids[keep])
+                if limit:
+                    chunk = chunk.head(limit - count)
+                # Insert in primary key order to keep B-tree page writes sequential
+                chunk = chunk.sort_values('id', kind='stable')
                 
-                item_id = self.safe_int(row.get('id'))
-                if not item_id:
-                    skipped += 1
-                    continue
+                chunk['title'] = self.truncate(chunk['title'], 255)
+                chunk['description'] = self.truncate(chunk['description'], 1000)
+                chunk['price'] = self.to_float(chunk['price'])
                 
-                if item_id in existing_item_ids:
-                    skipped += 1
-                    continue
+                # Create placeholders for every missing place in the chunk at once
+                missing_places = np.setdiff1d(chunk['user_id'].to_numpy(), valid_place_ids)
+                if len(missing_places):
+                    self.create_placeholder_places(missing_places, batch_size)
+                    valid_place_ids = self.known_ids(Place)
                 
-                # Get place_id from user_id (items belong to place via user)
-                place_id = self.safe_int(row.get('user_id'))
-                if not place_id or place_id not in valid_place_ids:
-                    # Create a placeholder place if needed
-                    if place_id and place_id not in valid_place_ids:
-                        Place.objects.get_or_create(
-                            id=place_id,
-                            defaults={'title': f'Place {place_id}', 'active': True}
-                        )
-                        valid_place_ids.add(place_id)
-                    else:
-                        skipped += 1
-                        continue
+                items_to_create = [
+                    _fast_construct(
+                        Item,
+                        id=pk,
+                        place_id=place_id,
+                        title=title,
+                        description=description,
+                        price=price,
+                    )
+                    for pk, place_id, title, description, price in chunk.itertuples(index=False, name=None)
+                ]
                 
-                item = Item(
-                    id=item_id,
-                    place_id=place_id,
-                    title=row.get('title', f'Item {item_id}')[:255],
-                    description=row.get('description', '')[:1000] if row.get('description') else '',
-                    price=self.safe_decimal(row.get('price'), Decimal('0')),
-                )
-                items_to_create.append(item)
-                count += 1
+                self.bulk_insert(Item, items_to_create, batch_size)
+                existing_item_ids = self.add_known_ids(Item, chunk['id'].to_numpy())
+                count += len(items_to_create)
+                self.stdout.write(f'  Created {count} items...')
                 
-                if len(items_to_create) >= batch_size:
-                    Item.objects.bulk_create(items_to_create, ignore_conflicts=True)
-                    self.stdout.write(f'  Created {count} items...')
-                    items_to_create = []
-        
-        # Create remaining
-        if items_to_create:
-            Item.objects.bulk_create(items_to_create, ignore_conflicts=True)
+                if limit and count >= limit:
+                    break
         
         self.stdout.write(self.style.SUCCESS(
             f'Loaded {count} items ({skipped} skipped)'
@@ -261,63 +685,64 @@ class Command(BaseCommand):
         
         self.stdout.write(f'Loading orders from {filepath}...')
         
-        # Get existing order IDs and place IDs
-        existing_order_ids = set(Order.objects.values_list('id', flat=True))
-        valid_place_ids = set(Place.objects.values_list('id', flat=True))
+        # Get existing order IDs, external IDs and place IDs
+        existing_order_ids = self.known_ids(Order)
+        existing_external_ids = self.known_external_ids(Order)
+        valid_place_ids = self.known_ids(Place)
         
-        orders_to_create = []
+        columns = ['id', 'place_id', 'status', 'total_amount', 'payment_method', 'created']
         count = 0
         skipped = 0
         
-        with open(filepath, 'r', encoding='utf-8', errors='replace') as f:
-            reader = csv.DictReader(f)
-            
-            for row in reader:
-                if limit and count >= limit:
-                    break
-                
-                order_id = self.safe_int(row.get('id'))
-                if not order_id:
-                    skipped += 1
-                    continue
+        with self.bulk_transaction():
+            for chunk in self.read_chunks(filepath, batch_size, columns):
+                ids = self.to_int(chunk['id'])
+                place_ids = self.to_int(chunk['place_id'])
+                keep = (
+                    (ids != 0) & ~ids.isin(existing_order_ids)
+                    & ~ids.isin(existing_external_ids) & (place_ids != 0)
+                )
+                keep = self.first_occurrences(ids, keep)
+                skipped += int((~keep).sum())
+                chunk = chunk[keep].assign(id=ids[keep], place_id=place_ids[keep])
+                if limit:
+                    chunk = chunk.head(limit - count)
+                # Insert in primary key order to keep B-tree page writes sequential
+                chunk = chunk.sort_values('id', kind='stable')
                 
-                if order_id in existing_order_ids:
-                    skipped += 1
-                    continue
+                chunk['created'] = self.to_datetime(chunk['created'])
+                chunk['status'] = self.truncate(chunk['status'], 50)
+                chunk['payment_method'] = self.truncate(chunk['payment_method'], 50)
                 
-                place_id = self.safe_int(row.get('place_id'))
-                if not place_id:
-                    skipped += 1
-                    continue
+                # Create placeholders for every missing place in the chunk at once
+                missing_places = np.setdiff1d(chunk['place_id'].to_numpy(), valid_place_ids)
+                if len(missing_places):
+                    self.create_placeholder_places(missing_places, batch_size)
+                    valid_place_ids = self.known_ids(Place)
                 
-                # Create place if needed
-                if place_id not in valid_place_ids:
-                    Place.objects.get_or_create(
-                        id=place_id,
-                        defaults={'title': f'Place {place_id}', 'active': True}
+                orders_to_create = [
+                    _fast_construct(
+                        Order,
+                        id=pk,
+                        place_id=place_id,
+                        status=status,
+                        total_amount=safe_decimal(total_amount, Decimal('0')),
+                        payment_method=payment_method,
+                        created_at=created,
+                        external_id=str(pk),
                     )
-                    valid_place_ids.add(place_id)
+                    for (pk, place_id, status, total_amount, payment_method,
+                         created) in chunk.itertuples(index=False, name=None)
+                ]
                 
-                order = Order(
-                    id=order_id,
-                    place_id=place_id,
-                    status=row.get('status', 'Unknown')[:50],
-                    total_amount=self.safe_decimal(row.get('total_amount'), Decimal('0')),
-                    payment_method=row.get('payment_method', '')[:50] if row.get('payment_method') else '',
-                    created_at=self.safe_datetime(row.get('created')),
-                    external_id=str(order_id),
-                )
-                orders_to_create.append(order)
-                count += 1
+                self.bulk_insert(Order, orders_to_create, batch_size)
+                existing_order_ids = self.add_known_ids(Order, chunk['id'].to_numpy())
+                existing_external_ids = self.add_known_external_ids(Order, chunk['id'].to_numpy())
+                count += len(orders_to_create)
+                self.stdout.write(f'  Created {count} orders...')
                 
-                if len(orders_to_create) >= batch_size:
-                    Order.objects.bulk_create(orders_to_create, ignore_conflicts=True)
-                    self.stdout.write(f'  Created {count} orders...')
-                    orders_to_create = []
-        
-        # Create remaining
-        if orders_to_create:
-            Order.objects.bulk_create(orders_to_create, ignore_conflicts=True)
+                if limit and count >= limit:
+                    break
         
         self.stdout.write(self.style.SUCCESS(
             f'Loaded {count} orders ({skipped} skipped)'
@@ -335,60 +760,59 @@ class Command(BaseCommand):
         
         self.stdout.write(f'Loading order items from {filepath}...')
         
-        # Get existing order item IDs, order IDs, and item IDs
-        existing_ids = set(OrderItem.objects.values_list('id', flat=True))
-        valid_order_ids = set(Order.objects.values_list('id', flat=True))
-        valid_item_ids = set(Item.objects.values_list('id', flat=True))
+        # Get existing order item IDs and external IDs, order IDs, and item IDs
+        existing_ids = self.known_ids(OrderItem)
+        existing_external_ids = self.known_external_ids(OrderItem)
+        valid_order_ids = self.known_ids(Order)
+        valid_item_ids = self.known_ids(Item)
         
-        items_to_create = []
+        columns = ['id', 'order_id', 'item_id', 'quantity', 'price']
         count = 0
         skipped = 0
         
-        with open(filepath, 'r', encoding='utf-8', errors='replace') as f:
-            reader = csv.DictReader(f)
-            
-            for row in reader:
-                if limit and count >= limit:
-                    break
-                
-                oi_id = self.safe_int(row.get('id'))
-                if not oi_id:
-                    skipped += 1
-                    continue
-                
-                if oi_id in existing_ids:
-                    skipped += 1
-                    continue
-                
-                order_id = self.safe_int(row.get('order_id'))
-                if not order_id or order_id not in valid_order_ids:
-                    skipped += 1
-                    continue
+        with self.bulk_transaction():
+            for chunk in self.read_chunks(filepath, batch_size, columns):
+                ids = self.to_int(chunk['id'])
+                order_ids = self.to_int(chunk['order_id'])
+                keep = (
+                    (ids != 0) & ~ids.isin(existing_ids)
+                    & ~ids.isin(existing_external_ids) & order_ids.isin(valid_order_ids)
+                )
+                keep = self.first_occurrences(ids, keep)
+                skipped += int((~keep).sum())
+                chunk = chunk[keep].assign(id=ids[keep], order_id=order_ids[keep])
+                if limit:
+                    chunk = chunk.head(limit - count)
+                # Insert in primary key order to keep B-tree page writes sequential
+                chunk = chunk.sort_values('id', kind='stable')
                 
-                item_id = self.safe_int(row.get('item_id'))
-                # item_id can be null in OrderItem model
-                if item_id and item_id not in valid_item_ids:
-                    item_id = None  # Set to null if item doesn't exist
+                # item_id can be null in OrderItem model; null it if the item doesn't exist
+                item_ids = self.to_int(chunk['item_id'])
+                chunk['item_id'] = item_ids.astype(object).where(item_ids.isin(valid_item_ids), None)
+                # Floats are cast to NUMERIC by the database; only totals keep Decimal
+                chunk['quantity'] = self.to_float(chunk['quantity'], 1.0)
+                chunk['price'] = self.to_float(chunk['price'])
                 
-                order_item = OrderItem(
-                    id=oi_id,
-                    order_id=order_id,
-                    item_id=item_id,
-                    quantity=self.safe_decimal(row.get('quantity'), Decimal('1')),
-                    price=self.safe_decimal(row.get('price'), Decimal('0')),
-                    external_id=str(oi_id),
-                )
-                items_to_create.append(order_item)
-                count += 1
+                items_to_create = [
+                    _fast_construct(
+                        OrderItem,
+                        id=pk,
+                        order_id=order_id,
+                        item_id=item_id,
+                        quantity=quantity,
+                        price=price,
+                        external_id=str(pk),
+                    )
+                    for pk, order_id, item_id, quantity, price in chunk.itertuples(index=False, name=None)
+                ]
+                self.bulk_insert(OrderItem, items_to_create, batch_size)
+                existing_ids = self.add_known_ids(OrderItem, chunk['id'].to_numpy())
+                existing_external_ids = self.add_known_external_ids(OrderItem, chunk['id'].to_numpy())
+                count += len(items_to_create)
+                self.stdout.write(f'  Created {count} order items...')
                 
-                if len(items_to_create) >= batch_size:
-                    OrderItem.objects.bulk_create(items_to_create, ignore_conflicts=True)
-                    self.stdout.write(f'  Created {count} order items...')
-                    items_to_create = []
-        
-        # Create remaining
-        if items_to_create:
-            OrderItem.objects.bulk_create(items_to_create, ignore_conflicts=True)
+                if limit and count >= limit:
+                    break
         
         self.stdout.write(self.style.SUCCESS(
             f'Loaded {count} order items ({skipped} skipped)'
@@ -1,7 +1,9 @@
 import csv
+import heapq
 import os
 from datetime import datetime
 from django.core.management.base import BaseCommand
+from django.db import connection
 from django.utils import timezone
 from apps.core.models import Place, User
 from apps.inventory.models import StockCategory, AddOnCategory, AddOn, Item, SKU, BillOfMaterial, Batch
@@ -9,51 +11,82 @@ from apps.sales.models import Campaign, Order, OrderItem
 import random
 from datetime import timedelta
 
+try:
+    # Optional: COPY-based upserts on PostgreSQL
+    from django_bulk_load import bulk_upsert_models
+except ImportError:
+    bulk_upsert_models = None
+
 class Command(BaseCommand):
     help = 'Load data from CSV files into the database (Normalized)'
 
+    def upsert(self, model, objs, unique_field, update_fields, batch_size=5000):
+        """Insert objs, updating update_fields on rows that match unique_field."""
+        # Last row wins for keys repeated in the CSV; one statement can't touch a row twice
+        objs = list({getattr(obj, unique_field): obj for obj in objs}.values())
+        if bulk_upsert_models is not None and connection.vendor == 'postgresql':
+            bulk_upsert_models(objs, pk_field_names=[unique_field])
+            return
+        model.objects.bulk_create(
+            objs,
+            update_conflicts=True,
+            unique_fields=[unique_field],
+            update_fields=update_fields,
+            batch_size=batch_size
+        )
+
     def handle(self, *args, **options):
         self.stdout.write('Loading normalized data...')
         
         # Paths
         base_dir = 'data'
         
-        # Helper to read CSV
+        # Helper to stream CSV rows
         def read_csv(filename):
              path = os.path.join(base_dir, filename)
              if not os.path.exists(path):
                  print(f"Warning: {filename} not found.")
-                 return []
+                 return
              with open(path, 'r', encoding='utf-8') as f:
-                 return list(csv.DictReader(f))
+                 yield from csv.DictReader(f)
+
+        def created_key(row):
+            try:
+                return int(row.get('created') or 0)
+            except ValueError:
+                return 0
 
         # 1. Places
         self.stdout.write('Loading Places...')
         places_data = read_csv('dim_places.csv')
-        for row in places_data:
-            Place.objects.update_or_create(
+        places = [
+            Place(
                 id=row['id'],
-                defaults={
-                    'title': row.get('title', 'Unknown'),
-                    'currency': row.get('currency'),
-                    'country': row.get('country'),
-                    'timezone': row.get('timezone'),
-                    'active': row.get('active') == '1'
-                }
+                title=row.get('title', 'Unknown'),
+                currency=row.get('currency'),
+                country=row.get('country'),
+                timezone=row.get('timezone'),
+                active=row.get('active') == '1'
             )
+            for row in places_data
+        ]
+        self.upsert(Place, places, 'id', ['title', 'currency', 'country', 'timezone', 'active'])
 
         # 2. Users
         self.stdout.write('Loading Users...')
         users_data = read_csv('dim_users.csv')
         users_to_create = []
+        # Existing users (re-runs) clash on the unique username and are
+        # skipped by ignore_conflicts; only dedup within the CSV here
+        seen_emails = set()
         for row in users_data:
             email = row.get('email')
             if not email:
                 email = f"user_{row['id']}@example.com"
             
-            # Skip if exists (for re-runs)
-            if User.objects.filter(email=email).exists():
+            if email in seen_emails:
                 continue
+            seen_emails.add(email)
                 
             users_to_create.append(User(
                 username=email,
@@ -69,18 +102,22 @@ class Command(BaseCommand):
         # 3. Categories
         self.stdout.write('Loading Categories...')
         cats_data = read_csv('dim_stock_categories.csv')
-        for row in cats_data:
-            StockCategory.objects.update_or_create(
+        valid_place_ids = set(str(pk) for pk in Place.objects.values_list('id', flat=True))
+        categories = [
+            StockCategory(
                 external_id=row['id'],
-                defaults={
-                    'title': row.get('title', 'Unknown'),
-                    'place_id': row.get('place_id') if Place.objects.filter(id=row.get('place_id')).exists() else None
-                }
+                title=row.get('title', 'Unknown'),
+                place_id=row.get('place_id') if row.get('place_id') in valid_place_ids else None
             )
+            for row in cats_data
+        ]
+        self.upsert(StockCategory, categories, 'external_id', ['title', 'place_id'])
 
         # 4. Items (Inventory)
         self.stdout.write('Loading Items...')
         items_data = read_csv('dim_items.csv')
+        category_map = dict(StockCategory.objects.values_list('external_id', 'id'))
+        items = []
         for row in items_data:
             try:
                 price = float(row.get('price', 0) or 0)
@@ -88,28 +125,27 @@ class Command(BaseCommand):
                 price = 0
             
             section_id = row.get('section_id')
-            category = StockCategory.objects.filter(external_id=section_id).first() 
             
-            Item.objects.update_or_create(
+            # We assume place_id might be inferred or we skip it for now as it wasn't in dim_items directly? 
+            # check dim_items schema -> no place_id. Maybe it's global or derived from section?
+            # Let's leave place null for now or assume a default place if needed.
+            items.append(Item(
                 external_id=row['id'],
-                defaults={
-                    'title': row.get('title', 'Unknown'),
-                    'description': row.get('description', ''),
-                    'price': price,
-                    'category': category,
-                    # We assume place_id might be inferred or we skip it for now as it wasn't in dim_items directly? 
-                    # check dim_items schema -> no place_id. Maybe it's global or derived from section?
-                    # Let's leave place null for now or assume a default place if needed.
-                }
-            )
+                title=row.get('title', 'Unknown'),
+                description=row.get('description', ''),
+                price=price,
+                category_id=category_map.get(section_id),
+            ))
+        self.upsert(Item, items, 'external_id', ['title', 'description', 'price', 'category_id'])
 
         # 5. SKUs
         self.stdout.write('Loading SKUs...')
         skus_data = read_csv('dim_skus.csv')
+        item_map = dict(Item.objects.values_list('external_id', 'id'))
+        skus = []
         for row in skus_data:
-            item_id = row.get('item_id')
-            item = Item.objects.filter(external_id=item_id).first()
-            if not item:
+            item_pk = item_map.get(row.get('item_id'))
+            if item_pk is None:
                 continue
                 
             try:
@@ -117,35 +153,33 @@ class Command(BaseCommand):
             except:
                 qty = 0
             
-            sku, _ = SKU.objects.update_or_create(
+            skus.append(SKU(
                 external_id=row['id'],
-                defaults={
-                    'title': row.get('title', 'Unknown'),
-                    'item': item,
-                    'quantity': qty,
-                    'unit': row.get('unit', '')
-                }
-            )
-            
-            # Create dummy batches for this SKU
+                title=row.get('title', 'Unknown'),
+                item_id=item_pk,
+                quantity=qty,
+                unit=row.get('unit', '')
+            ))
+        self.upsert(SKU, skus, 'external_id', ['title', 'item_id', 'quantity', 'unit'])
+        
+        # Create dummy batches for these SKUs
+        for sku in SKU.objects.filter(external_id__in=[s.external_id for s in skus]):
             Batch.objects.get_or_create(
                 sku=sku,
                 defaults={
-                    'quantity': qty,
+                    'quantity': sku.quantity,
                     'expiration_date': timezone.now().date() + timedelta(days=random.randint(2, 30))
                 }
             )
 
         # 6. Orders
         self.stdout.write('Loading Orders (Top 1000 latest)...')
-        orders_data = read_csv('fct_orders.csv')
-        # Sort by date desc and take top 1000 to save time
-        orders_data.sort(key=lambda x: x['created'], reverse=True)
-        orders_data = orders_data[:1000]
+        # Keep only the 1000 latest while streaming, instead of sorting the whole file
+        orders_data = heapq.nlargest(1000, read_csv('fct_orders.csv'), key=created_key)
         
         for row in orders_data:
             place_id = row.get('place_id')
-            if not Place.objects.filter(id=place_id).exists():
+            if place_id not in valid_place_ids:
                 continue
                 
             user_external_id = row.get('user_id')
@@ -174,25 +208,23 @@ class Command(BaseCommand):
         self.stdout.write('Loading OrderItems...')
         oi_data = read_csv('fct_order_items.csv')
         # Filter for loaded orders
-        loaded_order_ids = set(Order.objects.values_list('external_id', flat=True))
+        order_map = dict(Order.objects.values_list('external_id', 'id'))
+        item_map = dict(Item.objects.values_list('external_id', 'id'))
         
         items_to_create = []
         for row in oi_data:
-            order_id = row.get('order_id')
-            if order_id not in loaded_order_ids:
+            order_pk = order_map.get(row.get('order_id'))
+            if order_pk is None:
                 continue
                 
-            item_id = row.get('item_id')
-            item = Item.objects.filter(external_id=item_id).first()
-            if not item:
+            item_pk = item_map.get(row.get('item_id'))
+            if item_pk is None:
                 continue
-                
-            order = Order.objects.get(external_id=order_id)
             
             items_to_create.append(OrderItem(
                 external_id=row['id'],
-                order=order,
-                item=item,
+                order_id=order_pk,
+                item_id=item_pk,
                 quantity=row.get('quantity', 1),
                 price=row.get('price', 0)
             ))
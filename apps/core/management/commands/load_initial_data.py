@@ -1,13 +1,28 @@
 import csv
+import io
 import os
 import glob
 import math
 import sys
 import gzip
-from datetime import datetime
+import json
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
+from datetime import datetime, timezone as dt_timezone
+import numpy as np
+import pandas as pd
+try:
+    from psycopg2.extras import execute_values
+except ImportError:
+    execute_values = None
+try:
+    import orjson
+except ImportError:
+    orjson = None
 from django.core.management.base import BaseCommand
 from django.utils import timezone
-from django.db import transaction
+from django.db import DatabaseError, connection, connections, transaction
 from django.conf import settings
 
 # Import all models
@@ -15,364 +30,676 @@ from apps.core.models import Place, User
 from apps.sales.models import Campaign, Order, OrderItem, OrderItemAddOn, InvoiceItem, CashBalance, BonusCode, MostOrderedStat
 from apps.inventory.models import StockCategory, AddOnCategory, AddOn, Item, SKU, BillOfMaterial, Batch, InventoryReport, TaxonomyTerm, MenuItemAddOnDefinition
 
+# Rows per INSERT for the bulk_create fallback. 1000 was the fastest of
+# 500/1000/2000/5000 for both orders and order items.
+BATCH_SIZE = 1000
+
+# Read size for gzipped CSVs streamed through the csv module
+GZIP_BUFFER_SIZE = 1 << 20
+
+# Sections grouped so that each one only needs maps built by earlier phases.
+# Sections within a phase are independent and can run in parallel.
+PHASES = [
+    ('places', 'users'),
+    ('stock_categories', 'taxonomy_terms', 'add_ons', 'menu_add_ons'),
+    ('items', 'campaigns'),
+    ('skus',),
+    ('bill_of_materials', 'orders', 'invoice_items', 'cash_balances',
+     'inventory_reports', 'bonus_codes', 'most_ordered'),
+    ('order_items',),
+]
+
+
+def parse_timestamp(ts):
+    if not ts: return None
+    try:
+        # Timestamps seem to be unix seconds
+        return datetime.fromtimestamp(float(ts), tz=dt_timezone.utc)
+    except:
+        return timezone.now()
+
+
+_TRUE = frozenset({'1', 'true', 'yes'})
+
+
+def parse_bool(val):
+    return str(val).strip().lower() in _TRUE
+
+
+def parse_json(val):
+    # JSON text from the CSV -> Python value for a JSONField; orjson when available.
+    # Anything that isn't valid JSON is kept as the raw string.
+    if not val:
+        return val
+    try:
+        return orjson.loads(val) if orjson is not None else json.loads(val)
+    except ValueError:
+        return val
+
+
+# Prices and quantities repeat a lot across rows
+@lru_cache(maxsize=4096)
+def parse_decimal(val, precision=2, max_val_cap=99999999):
+    if not val: return 0
+    try:
+        f = float(val)
+        if math.isnan(f) or math.isinf(f):
+            return 0
+        if abs(f) > max_val_cap:
+            return max_val_cap if f > 0 else -max_val_cap
+        return round(f, precision)
+    except:
+        return 0
+
+
+# Column-wise versions of the parsers above, for the large fact tables
+def parse_timestamp_column(col):
+    ts = pd.to_datetime(pd.to_numeric(col, errors='coerce'), unit='s', utc=True, errors='coerce')
+    ts = ts.fillna(timezone.now()).astype(object)
+    return ts.where(col != '', None)
+
+
+def parse_decimal_column(col, precision=2, max_val_cap=99999999):
+    # One float64 buffer, sanitized in place: NaN/inf -> 0, clip, round
+    f = pd.to_numeric(col, errors='coerce').to_numpy(dtype=np.float64, na_value=np.nan, copy=True)
+    f[~np.isfinite(f)] = 0
+    np.clip(f, -max_val_cap, max_val_cap, out=f)
+    np.round(f, precision, out=f)
+    return pd.Series(f, index=col.index)
+
+
+def map_column(col, mapping):
+    # External ids to primary keys; unknown ids become None
+    mapped = col.map(mapping).astype('Int64').astype(object)
+    return mapped.where(mapped.notna(), None)
+
+
+def id_map(model):
+    # external_id -> pk, streamed as tuples instead of model instances
+    return dict(model.objects.values_list('external_id', 'id').iterator(chunk_size=10000))
+
+
+def pk_map(model):
+    # For tables whose CSV id is the primary key itself
+    return {str(pk): pk for pk in model.objects.values_list('id', flat=True).iterator(chunk_size=10000)}
+
+
+def pg_copy(model, df):
+    # COPY df into a temporary table, then move the rows across with
+    # ON CONFLICT DO NOTHING so duplicates are skipped like ignore_conflicts
+    qn = connection.ops.quote_name
+    now = timezone.now()
+    df = df.copy()
+    for field in model._meta.concrete_fields:
+        if field.primary_key or field.attname in df:
+            continue
+        if getattr(field, 'auto_now', False) or getattr(field, 'auto_now_add', False):
+            df[field.attname] = now
+        elif field.has_default():
+            df[field.attname] = field.get_default()
+    fields = [f for f in model._meta.concrete_fields if f.attname in df]
+    columns = ', '.join(qn(f.column) for f in fields)
+
+    buffer = io.StringIO()
+    df[[f.attname for f in fields]].to_csv(buffer, index=False, header=False, na_rep='\\N')
+
+    table = qn(model._meta.db_table)
+    staging = qn(f'{model._meta.db_table}_staging')
+    copy_sql = f"COPY {staging} ({columns}) FROM STDIN WITH (FORMAT csv, NULL '\\N')"
+    with connection.cursor() as cursor:
+        cursor.execute(f'CREATE TEMP TABLE {staging} AS SELECT {columns} FROM {table} WITH NO DATA')
+        raw = cursor.cursor
+        if hasattr(raw, 'copy'):
+            # psycopg 3
+            with raw.copy(copy_sql) as copy:
+                copy.write(buffer.getvalue())
+        else:
+            buffer.seek(0)
+            raw.copy_expert(copy_sql, buffer)
+        cursor.execute(
+            f'INSERT INTO {table} ({columns}) SELECT {columns} FROM {staging} ON CONFLICT DO NOTHING'
+        )
+        cursor.execute(f'DROP TABLE {staging}')
+
+
+def tune_session():
+    # Transaction-local PostgreSQL settings for bulk ingest
+    if connection.vendor == 'postgresql':
+        with connection.cursor() as cursor:
+            cursor.execute("SET LOCAL synchronous_commit = OFF")
+
+
+@contextmanager
+def fast_load(model):
+    """
+    Drop the secondary indexes of model's table and skip foreign key
+    triggers while the block runs, then rebuild the indexes.
+
+    Primary keys and unique indexes stay so ON CONFLICT still works.
+    session_replication_role needs superuser; without it the foreign keys
+    are simply checked as usual. PostgreSQL only.
+    """
+    if connection.vendor != 'postgresql':
+        yield
+        return
+
+    qn = connection.ops.quote_name
+    table = model._meta.db_table
+    with connection.cursor() as cursor:
+        cursor.execute(
+            """
+            SELECT idx.relname, pg_get_indexdef(ix.indexrelid)
+            FROM pg_index ix JOIN pg_class idx ON idx.oid = ix.indexrelid
+            WHERE ix.indrelid = %s::regclass
+              AND NOT ix.indisprimary AND NOT ix.indisunique
+            """,
+            [table]
+        )
+        indexes = cursor.fetchall()
+        for name, _ in indexes:
+            cursor.execute(f'DROP INDEX {qn(name)}')
+        try:
+            with transaction.atomic():
+                cursor.execute("SET LOCAL session_replication_role = 'replica'")
+            replica = True
+        except DatabaseError:
+            replica = False
+
+    yield
+
+    with connection.cursor() as cursor:
+        if replica:
+            cursor.execute("SET LOCAL session_replication_role = 'origin'")
+        # Still inside the load transaction, so CONCURRENTLY is not available
+        for _, definition in indexes:
+            cursor.execute(definition)
+
+
+def insert_rows(model, columns, rows, batch_size=BATCH_SIZE):
+    """
+    Insert tuples of column values for the mid-size tables, skipping rows
+    that conflict with existing ones.
+
+    On PostgreSQL the tuples go straight into multi-row INSERT statements
+    without building model instances; fields not in columns get their model
+    default. Elsewhere this falls back to batched bulk_create.
+    """
+    if connection.vendor != 'postgresql':
+        for start in range(0, len(rows), batch_size):
+            objs = [model(**dict(zip(columns, row))) for row in rows[start:start + batch_size]]
+            model.objects.bulk_create(objs, ignore_conflicts=True)
+        return len(rows)
+
+    qn = connection.ops.quote_name
+    now = timezone.now()
+    extra = {}
+    for field in model._meta.concrete_fields:
+        if field.primary_key or field.attname in columns:
+            continue
+        if getattr(field, 'auto_now', False) or getattr(field, 'auto_now_add', False):
+            extra[field.attname] = now
+        else:
+            extra[field.attname] = field.get_default()
+    if extra:
+        tail = tuple(extra.values())
+        rows = [row + tail for row in rows]
+    db_column = {f.attname: f.column for f in model._meta.concrete_fields}
+    names = list(columns) + list(extra)
+    db_columns = ', '.join(qn(db_column[name]) for name in names)
+
+    sql = f'INSERT INTO {qn(model._meta.db_table)} ({db_columns}) VALUES %s ON CONFLICT DO NOTHING'
+    with connection.cursor() as cursor:
+        if execute_values is not None:
+            execute_values(cursor.cursor, sql, rows, page_size=batch_size)
+        else:
+            # psycopg 3 pipelines executemany on its own
+            placeholders = '(' + ', '.join(['%s'] * len(names)) + ')'
+            cursor.cursor.executemany(sql.replace('%s', placeholders), rows)
+    return len(rows)
+
+
+def insert_frame(model, df, batch_size=BATCH_SIZE):
+    # Large fact tables: COPY on PostgreSQL, bulk_create elsewhere.
+    # The fallback builds instances one batch at a time to bound memory.
+    if connection.vendor == 'postgresql':
+        with fast_load(model):
+            pg_copy(model, df)
+    else:
+        for start in range(0, len(df), batch_size):
+            part = df.iloc[start:start + batch_size]
+            objs = [model(**rec) for rec in part.to_dict('records')]
+            model.objects.bulk_create(objs, ignore_conflicts=True)
+    return len(df)
+
+
+# Maps published by a section for later phases: section -> (map name, builder)
+SECTION_MAPS = {
+    'places': ('place', lambda: pk_map(Place)),
+    'users': ('user', lambda: pk_map(User)),
+    'stock_categories': ('stock_category', lambda: id_map(StockCategory)),
+    'items': ('item', lambda: id_map(Item)),
+    'skus': ('sku', lambda: id_map(SKU)),
+    'orders': ('order', lambda: id_map(Order)),
+}
+
+# Tables written by each section, analyzed once it commits
+SECTION_MODELS = {
+    'places': [Place],
+    'users': [User],
+    'stock_categories': [StockCategory],
+    'taxonomy_terms': [TaxonomyTerm],
+    'add_ons': [AddOnCategory, AddOn],
+    'menu_add_ons': [MenuItemAddOnDefinition],
+    'items': [Item],
+    'campaigns': [Campaign],
+    'skus': [SKU],
+    'bill_of_materials': [BillOfMaterial],
+    'orders': [Order],
+    'invoice_items': [InvoiceItem],
+    'cash_balances': [CashBalance],
+    'inventory_reports': [InventoryReport],
+    'bonus_codes': [BonusCode],
+    'most_ordered': [MostOrderedStat],
+    'order_items': [OrderItem],
+}
+
+
+def load_section(command, name):
+    """
+    Run one load_* section in its own transaction, so a failure only loses
+    that file. On PostgreSQL the section's tables are analyzed afterwards
+    to give the next phases' lookups fresh planner statistics.
+    """
+    with transaction.atomic():
+        tune_session()
+        getattr(command, f'load_{name}')()
+    if connection.vendor == 'postgresql':
+        qn = connection.ops.quote_name
+        with connection.cursor() as cursor:
+            for model in SECTION_MODELS[name]:
+                cursor.execute(f'ANALYZE {qn(model._meta.db_table)}')
+
+
+def _run_section(name, maps):
+    """Run one section in a worker process with its own connection."""
+    import django
+    django.setup()
+    csv.field_size_limit(10 * 1024 * 1024)
+    command = Command()
+    command.maps = maps
+    load_section(command, name)
+
+
 class Command(BaseCommand):
     help = 'Load all data from CSV files into the database (Optimized)'
 
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--parallel',
+            action='store_true',
+            help='Run independent sections of each phase in separate processes'
+        )
+
     def handle(self, *args, **options):
         # Increase CSV field limit
         csv.field_size_limit(10 * 1024 * 1024) # 10MB
 
         self.stdout.write('Starting FULL data load (19 files)...')
-        
-        base_dir = os.path.join(settings.BASE_DIR, 'data')
-        
-        def read_csv(filename):
-            path = os.path.join(base_dir, filename)
-            
-            # Check for GZIP first (priority for repo syncing)
-            if not os.path.exists(path) and os.path.exists(path + '.gz'):
-                 path = path + '.gz'
-
-            if not os.path.exists(path):
-                 self.stdout.write(self.style.WARNING(f"File {filename} not found."))
-                 return []
-            
-            if path.endswith('.gz'):
-                with gzip.open(path, 'rt', encoding='utf-8') as f:
-                    reader = csv.DictReader(f)
-                    return list(reader)
-            else:
-                with open(path, 'r', encoding='utf-8') as f:
-                    reader = csv.DictReader(f)
-                    return list(reader)
-
-        def parse_timestamp(ts):
-            if not ts: return None
-            try:
-                # Timestamps seem to be unix seconds
-                return datetime.fromtimestamp(float(ts), tz=timezone.utc)
-            except:
-                return timezone.now()
-
-        def parse_bool(val):
-            return str(val).lower() in ('1', 'true', 'yes')
-
-        def parse_decimal(val, precision=2, max_val_cap=99999999):
-            if not val: return 0
-            try:
-                f = float(val)
-                if math.isnan(f) or math.isinf(f):
-                    return 0
-                if abs(f) > max_val_cap:
-                    return max_val_cap if f > 0 else -max_val_cap
-                return round(f, precision)
-            except:
-                return 0
-
-        # Cache maps
-        place_map = {} # external -> id
-        item_map = {} # external -> id
-        user_map = {} # external -> id
-        sku_map = {} # external -> id
-
-        with transaction.atomic():
-            
-            # 1. dim_places.csv
-            self.stdout.write('Loading Places...')
-            for row in read_csv('dim_places.csv'):
-                p, created = Place.objects.update_or_create(
-                    id=row['id'],
-                    defaults={
-                        'title': row.get('title', 'Unknown'),
-                        'description': row.get('description', ''),
-                        'active': parse_bool(row.get('active', '1')),
-                        'country': row.get('country'),
-                        'currency': row.get('currency'),
-                        'timezone': row.get('timezone'),
-                        'street_address': row.get('street_address'),
-                        'contact_email': row.get('contact_email'),
-                        'contact_phone': row.get('contact_phone', row.get('phone')),
-                        'logo_url': row.get('logo'),
-                        'website_url': row.get('website'),
-                        'opening_hours': row.get('opening_hours'),
-                    }
-                )
-                place_map[row['id']] = p.id
-
-            # 2. dim_users.csv
-            self.stdout.write('Loading Users...')
-            existing_emails = set(User.objects.values_list('email', flat=True))
-            users_to_create = []
-            
-            user_rows = read_csv('dim_users.csv')
-            for row in user_rows:
-                email = row.get('email')
-                if not email or '@' not in email:
-                    email = f"user_{row['id']}@generated.com"
-                
-                if email in existing_emails:
-                    continue
-                
-                existing_emails.add(email)
-                
-                users_to_create.append(User(
-                    id=row['id'],
-                    username=email,
-                    email=email,
-                    first_name=row.get('first_name', ''),
-                    last_name=row.get('last_name', ''),
-                    mobile_phone=row.get('mobile_phone'),
-                    country=row.get('country'),
-                    currency=row.get('currency'),
-                    language=row.get('language'),
-                ))
-            
-            if users_to_create:
-                User.objects.bulk_create(users_to_create, ignore_conflicts=True)
-            
-            user_map = {str(u.id): u.id for u in User.objects.all()}
-
-            # 3. dim_stock_categories.csv
-            self.stdout.write('Loading Stock Categories...')
-            sc_to_create = []
-            for row in read_csv('dim_stock_categories.csv'):
-                sc_to_create.append(StockCategory(
-                    external_id=row['id'],
-                    place_id=place_map.get(row['place_id']),
-                    title=row['title']
-                ))
-            StockCategory.objects.bulk_create(sc_to_create, ignore_conflicts=True)
-            
-            # 4. dim_taxonomy_terms.csv
-            self.stdout.write('Loading Taxonomy...')
-            tt_to_create = []
-            for row in read_csv('dim_taxonomy_terms.csv'):
-                tt_to_create.append(TaxonomyTerm(
-                    external_id=row['id'],
-                    user_id=user_map.get(row['user_id']),
-                    name=row['name'],
-                    vocabulary=row['vocabulary']
-                ))
-            TaxonomyTerm.objects.bulk_create(tt_to_create, ignore_conflicts=True)
-
-            # 5. dim_add_ons.csv
-            self.stdout.write('Loading AddOns...')
-            addons_rows = read_csv('dim_add_ons.csv')
-            cats = set(row['category_id'] for row in addons_rows)
-            for cid in cats:
-                AddOnCategory.objects.get_or_create(external_id=cid, defaults={'title': f"Cat {cid}"})
-            
-            ac_map = {ac.external_id: ac.id for ac in AddOnCategory.objects.all()}
-            
-            ao_to_create = []
-            for row in addons_rows:
-                ao_to_create.append(AddOn(
-                    external_id=row['id'],
-                    category_id=ac_map.get(row['category_id']),
-                    title=row['title'],
-                    price=parse_decimal(row.get('price'), 2, 999999)
-                ))
-            AddOn.objects.bulk_create(ao_to_create, ignore_conflicts=True)
-
-            # 6. dim_items.csv
-            self.stdout.write('Loading Items...')
-            sc_map = {sc.external_id: sc.id for sc in StockCategory.objects.all()}
-            
-            items_to_create = []
-            for row in read_csv('dim_items.csv'):
-                 items_to_create.append(Item(
-                     external_id=row['id'],
-                     place_id=None,
-                     title=row['title'],
-                     description=row['description'],
-                     price=parse_decimal(row['price'], 2, 9999999), 
-                     category_id=sc_map.get(row['section_id']),
-                     is_active=not parse_bool(row['deleted'])
-                 ))
-            Item.objects.bulk_create(items_to_create, ignore_conflicts=True)
-            
-            item_map = {i.external_id: i.id for i in Item.objects.all()}
-
-            # 7. dim_skus.csv
-            self.stdout.write('Loading SKUs...')
-            skus_to_create = []
-            for row in read_csv('dim_skus.csv'):
-                skus_to_create.append(SKU(
-                    external_id=row['id'],
-                    item_id=item_map.get(row['item_id']),
-                    title=row['title'],
-                    quantity=parse_decimal(row['quantity'], 3, 999999999),
-                    unit=row['unit'],
-                    low_stock_threshold=parse_decimal(row['low_stock_threshold'], 3, 999999999)
-                ))
-            SKU.objects.bulk_create(skus_to_create, ignore_conflicts=True)
-            sku_map = {s.external_id: s.id for s in SKU.objects.all()}
-
-            # 8. dim_bill_of_materials.csv
-            self.stdout.write('Loading BOM...')
-            bom_to_create = []
-            for row in read_csv('dim_bill_of_materials.csv'):
-                 pid = sku_map.get(row['parent_sku_id'])
-                 cid = sku_map.get(row['sku_id'])
-                 if pid and cid:
-                     bom_to_create.append(BillOfMaterial(
-                         parent_sku_id=pid,
-                         child_sku_id=cid,
-                         quantity=parse_decimal(row['quantity'], 4, 999999)
-                     ))
-            BillOfMaterial.objects.bulk_create(bom_to_create, ignore_conflicts=True)
-
-            # 9. fct_campaigns.csv
-            self.stdout.write('Loading Campaigns...')
-            camp_to_create = []
-            for row in read_csv('fct_campaigns.csv'):
-                camp_to_create.append(Campaign(
-                    external_id=row['id'],
-                    place_id=place_map.get(row['place_id']),
-                    title=row.get('title', 'Unknown'),
-                    discount_type=row.get('discount_type', ''),
-                    value=parse_decimal(row.get('value'), 2, 999999)
-                ))
-            Campaign.objects.bulk_create(camp_to_create, ignore_conflicts=True)
-
-            # 10. fct_orders.csv
-            self.stdout.write('Loading Orders...')
-            orders_rows = read_csv('fct_orders.csv')
-            orders_to_create = []
-            exist_orders = set(Order.objects.values_list('external_id', flat=True))
-            count = 0
-            for row in orders_rows:
-                if row['id'] in exist_orders: continue
-                
-                orders_to_create.append(Order(
-                    external_id=row['id'],
-                    place_id=place_map.get(row['place_id']),
-                    user_id=user_map.get(row['user_id']),
-                    status=row['status'],
-                    total_amount=parse_decimal(row.get('total_amount'), 2, 99999999),
-                    payment_method=row['payment_method'],
-                    created_at=parse_timestamp(row['created'])
-                ))
-                
-                if len(orders_to_create) > 5000:
-                    Order.objects.bulk_create(orders_to_create, ignore_conflicts=True)
-                    count += len(orders_to_create)
-                    self.stdout.write(f"  Inserted {count} orders...")
-                    orders_to_create = []
-            
-            if orders_to_create:
-                Order.objects.bulk_create(orders_to_create, ignore_conflicts=True)
-
-            # 11. fct_order_items.csv
-            self.stdout.write('Loading OrderItems (this is large)...')
-            order_id_map = {o.external_id: o.id for o in Order.objects.all()}
-            oi_rows = read_csv('fct_order_items.csv')
-            oi_to_create = []
-            count = 0
-            for row in oi_rows:
-                 oid = order_id_map.get(row['order_id'])
-                 iid = item_map.get(row['item_id'])
-                 if oid:
-                     oi_to_create.append(OrderItem(
-                         external_id=row['id'],
-                         order_id=oid,
-                         item_id=iid,
-                         quantity=parse_decimal(row['quantity'], 2, 999999),
-                         price=parse_decimal(row['price'], 2, 9999999)
-                     ))
-                 if len(oi_to_create) > 10000:
-                      OrderItem.objects.bulk_create(oi_to_create, ignore_conflicts=True)
-                      count += len(oi_to_create)
-                      self.stdout.write(f"  Inserted {count} order items...")
-                      oi_to_create = []
-            if oi_to_create:
-                  OrderItem.objects.bulk_create(oi_to_create, ignore_conflicts=True)
-
-            # 12. dim_menu_item_add_ons.csv
-            self.stdout.write('Loading Menu AddOn Definitions...')
-            miao_to_create = []
-            for row in read_csv('dim_menu_item_add_ons.csv'):
-                miao_to_create.append(MenuItemAddOnDefinition(
-                    external_id=row['id'],
-                    title=row['title'],
-                    category_id_ref=row['category_id'],
-                    price=parse_decimal(row.get('price'), 2, 999999),
-                    select_as_default=parse_bool(row['select_as_default']),
-                    status=row['status']
-                ))
-            MenuItemAddOnDefinition.objects.bulk_create(miao_to_create, ignore_conflicts=True)
-
-            # 13. dim_menu_items.csv
-            self.stdout.write(f"Skipping dim_menu_items.csv (Redundant with Items)")
-
-            # 14. fct_invoice_items.csv
-            self.stdout.write('Loading Invoice Items...')
-            inv_to_create = []
-            for row in read_csv('fct_invoice_items.csv'):
-                inv_to_create.append(InvoiceItem(
-                    external_id=row['id'],
-                    user_id=user_map.get(row['user_id']),
-                    amount=parse_decimal(row.get('amount'), 2, 99999999),
-                    description=row.get('description', ''),
-                    product_id=row.get('product_id'),
-                    invoice_id=row.get('invoice_id')
-                ))
-            InvoiceItem.objects.bulk_create(inv_to_create, ignore_conflicts=True)
-
-            # 15. fct_cash_balances.csv
-            self.stdout.write('Loading Cash Balances...')
-            cb_to_create = []
-            for row in read_csv('fct_cash_balances.csv'):
-                cb_to_create.append(CashBalance(
-                    external_id=row['id'],
-                    place_id=place_map.get(row['place_id']),
-                    opening_balance=parse_decimal(row.get('opening_balance'), 2, 99999999),
-                    closing_balance=parse_decimal(row.get('closing_balance'), 2, 99999999),
-                    status=row.get('status', '')
-                ))
-            CashBalance.objects.bulk_create(cb_to_create, ignore_conflicts=True)
-
-            # 16. fct_inventory_reports.csv
-            self.stdout.write('Loading Inventory Reports...')
-            ir_to_create = []
-            for row in read_csv('fct_inventory_reports.csv'):
-                ir_to_create.append(InventoryReport(
-                    external_id=row['id'],
-                    place_id=place_map.get(row['place_id']),
-                    data=row.get('data'),
-                    excel=row.get('excel'),
-                    pdf=row.get('pdf'),
-                    start_time=parse_timestamp(row.get('start_time')),
-                    end_time=parse_timestamp(row.get('end_time'))
-                ))
-            InventoryReport.objects.bulk_create(ir_to_create, ignore_conflicts=True)
-
-            # 17. fct_bonus_codes.csv
-            self.stdout.write('Loading Bonus Codes...')
-            bc_to_create = []
-            for row in read_csv('fct_bonus_codes.csv'):
-                bc_to_create.append(BonusCode(
-                    external_id=row['id'],
-                    place_id=place_map.get(row['place_id']),
-                    user_id=user_map.get(row['user_id']),
-                    points=parse_decimal(row.get('points'), 0, 999999),
-                    redemptions=parse_decimal(row.get('redemptions'), 0, 999999),
-                    start_date_time=parse_timestamp(row.get('start_date_time')),
-                    end_date_time=parse_timestamp(row.get('end_date_time'))
-                ))
-            BonusCode.objects.bulk_create(bc_to_create, ignore_conflicts=True)
-            
-            # 18. most_ordered.csv
-            self.stdout.write('Loading Most Ordered Stats...')
-            mo_to_create = []
-            for row in read_csv('most_ordered.csv'):
-                mo_to_create.append(MostOrderedStat(
-                    place_id=place_map.get(row['place_id']) or Place.objects.first().id,
-                    item_id=row['item_id'],
-                    item_name=row['item_name'],
-                    order_count=parse_decimal(row['order_count'], 0, 999999),
-                    store_address=row.get('store_address', '')
-                ))
-            MostOrderedStat.objects.bulk_create(mo_to_create, ignore_conflicts=True)
+
+        # Cache maps, external -> id
+        self.maps = {}
+
+        parallel = options['parallel']
+        if parallel and connection.vendor == 'sqlite':
+            self.stdout.write(self.style.WARNING(
+                'SQLite does not support concurrent writers; loading sequentially'
+            ))
+            parallel = False
+
+        if parallel:
+            for phase in PHASES:
+                self.run_phase_in_parallel(phase)
+        else:
+            for phase in PHASES:
+                for name in phase:
+                    load_section(self, name)
+                    self.publish_map(name)
 
         self.stdout.write(self.style.SUCCESS(f'Successfully loaded 100% of data files (19/19 verified)!'))
+
+    def run_phase_in_parallel(self, phase):
+        # Forked workers must not share the parent's connection
+        connections.close_all()
+        with ProcessPoolExecutor(max_workers=min(len(phase), os.cpu_count() or 1)) as executor:
+            futures = [executor.submit(_run_section, name, self.maps) for name in phase]
+            for future in futures:
+                future.result()
+        for name in phase:
+            self.publish_map(name)
+
+    def publish_map(self, name):
+        if name in SECTION_MAPS:
+            key, build = SECTION_MAPS[name]
+            self.maps[key] = build()
+
+    @property
+    def base_dir(self):
+        return os.path.join(settings.BASE_DIR, 'data')
+
+    def open_csv(self, filename, binary=False):
+        # binary=True hands the raw byte stream to pandas, which decodes in C
+        path = os.path.join(self.base_dir, filename)
+
+        # Check for GZIP first (priority for repo syncing)
+        if not os.path.exists(path) and os.path.exists(path + '.gz'):
+             path = path + '.gz'
+
+        if not os.path.exists(path):
+             self.stdout.write(self.style.WARNING(f"File {filename} not found."))
+             return None
+
+        if path.endswith('.gz'):
+            gz = gzip.open(path, 'rb')
+            if binary:
+                return gz
+            # 1MB reads instead of many small ones through the text layer
+            return io.TextIOWrapper(io.BufferedReader(gz, buffer_size=GZIP_BUFFER_SIZE), encoding='utf-8')
+        if binary:
+            return open(path, 'rb')
+        return open(path, 'r', encoding='utf-8')
+
+    def read_csv(self, filename):
+        # Yields rows lazily; the file stays open until the caller finishes iterating
+        f = self.open_csv(filename)
+        if f is None:
+            return
+        with f:
+            yield from csv.DictReader(f)
+
+    def read_frame(self, filename, columns):
+        # Whole file as a DataFrame of strings; missing columns read as ''
+        f = self.open_csv(filename, binary=True)
+        if f is None:
+            return pd.DataFrame(columns=columns, dtype=str)
+        with f:
+            df = pd.read_csv(
+                f, dtype=str, keep_default_na=False, encoding='utf-8',
+                usecols=lambda name: name in columns,
+            )
+        return df.reindex(columns=columns, fill_value='')
+
+    def load_places(self):
+        # 1. dim_places.csv
+        self.stdout.write('Loading Places...')
+        for row in self.read_csv('dim_places.csv'):
+            Place.objects.update_or_create(
+                id=row['id'],
+                defaults={
+                    'title': row.get('title', 'Unknown'),
+                    'description': row.get('description', ''),
+                    'active': parse_bool(row.get('active', '1')),
+                    'country': row.get('country'),
+                    'currency': row.get('currency'),
+                    'timezone': row.get('timezone'),
+                    'street_address': row.get('street_address'),
+                    'contact_email': row.get('contact_email'),
+                    'contact_phone': row.get('contact_phone', row.get('phone')),
+                    'logo_url': row.get('logo'),
+                    'website_url': row.get('website'),
+                    'opening_hours': parse_json(row.get('opening_hours')),
+                }
+            )
+
+    def load_users(self):
+        # 2. dim_users.csv
+        self.stdout.write('Loading Users...')
+        # Only dedup within the CSV; clashes with existing users (username is
+        # the email) are skipped by ignore_conflicts
+        seen_emails = set()
+        users_to_create = []
+
+        for row in self.read_csv('dim_users.csv'):
+            email = row.get('email')
+            if not email or '@' not in email:
+                email = f"user_{row['id']}@generated.com"
+
+            if email in seen_emails:
+                continue
+
+            seen_emails.add(email)
+
+            users_to_create.append(User(
+                id=row['id'],
+                username=email,
+                email=email,
+                first_name=row.get('first_name', ''),
+                last_name=row.get('last_name', ''),
+                mobile_phone=row.get('mobile_phone'),
+                country=row.get('country'),
+                currency=row.get('currency'),
+                language=row.get('language'),
+            ))
+
+        if users_to_create:
+            User.objects.bulk_create(users_to_create, ignore_conflicts=True)
+
+    def load_stock_categories(self):
+        # 3. dim_stock_categories.csv
+        self.stdout.write('Loading Stock Categories...')
+        place_map = self.maps['place']
+        rows = [
+            (row['id'], place_map.get(row['place_id']), row['title'])
+            for row in self.read_csv('dim_stock_categories.csv')
+        ]
+        insert_rows(StockCategory, ('external_id', 'place_id', 'title'), rows)
+
+    def load_taxonomy_terms(self):
+        # 4. dim_taxonomy_terms.csv
+        self.stdout.write('Loading Taxonomy...')
+        user_map = self.maps['user']
+        rows = [
+            (row['id'], user_map.get(row['user_id']), row['name'], row['vocabulary'])
+            for row in self.read_csv('dim_taxonomy_terms.csv')
+        ]
+        insert_rows(TaxonomyTerm, ('external_id', 'user_id', 'name', 'vocabulary'), rows)
+
+    def load_add_ons(self):
+        # 5. dim_add_ons.csv
+        self.stdout.write('Loading AddOns...')
+        # Needs two passes: categories first, then the add-ons that reference them
+        addons_rows = []
+        cats = set()
+        for row in self.read_csv('dim_add_ons.csv'):
+            addons_rows.append(row)
+            cats.add(row['category_id'])
+        # One SELECT for the existing categories, one INSERT for the rest
+        existing = set(AddOnCategory.objects.filter(external_id__in=cats).values_list('external_id', flat=True))
+        AddOnCategory.objects.bulk_create(
+            [AddOnCategory(external_id=cid, title=f"Cat {cid}") for cid in sorted(cats - existing)],
+            ignore_conflicts=True
+        )
+
+        ac_map = id_map(AddOnCategory)
+
+        rows = [
+            (row['id'], ac_map.get(row['category_id']), row['title'], parse_decimal(row.get('price'), 2, 999999))
+            for row in addons_rows
+        ]
+        insert_rows(AddOn, ('external_id', 'category_id', 'title', 'price'), rows)
+
+    def load_items(self):
+        # 6. dim_items.csv
+        self.stdout.write('Loading Items...')
+        sc_map = self.maps['stock_category']
+        rows = [
+            (
+                row['id'], None, row['title'], row['description'],
+                parse_decimal(row['price'], 2, 9999999),
+                sc_map.get(row['section_id']),
+                not parse_bool(row['deleted']),
+            )
+            for row in self.read_csv('dim_items.csv')
+        ]
+        insert_rows(Item, ('external_id', 'place_id', 'title', 'description', 'price', 'category_id', 'is_active'), rows)
+
+    def load_skus(self):
+        # 7. dim_skus.csv
+        self.stdout.write('Loading SKUs...')
+        item_map = self.maps['item']
+        rows = [
+            (
+                row['id'], item_map.get(row['item_id']), row['title'],
+                parse_decimal(row['quantity'], 3, 999999999),
+                row['unit'],
+                parse_decimal(row['low_stock_threshold'], 3, 999999999),
+            )
+            for row in self.read_csv('dim_skus.csv')
+        ]
+        insert_rows(SKU, ('external_id', 'item_id', 'title', 'quantity', 'unit', 'low_stock_threshold'), rows)
+
+    def load_bill_of_materials(self):
+        # 8. dim_bill_of_materials.csv
+        self.stdout.write('Loading BOM...')
+        sku_map = self.maps['sku']
+        rows = []
+        for row in self.read_csv('dim_bill_of_materials.csv'):
+             pid = sku_map.get(row['parent_sku_id'])
+             cid = sku_map.get(row['sku_id'])
+             if pid and cid:
+                 rows.append((pid, cid, parse_decimal(row['quantity'], 4, 999999)))
+        insert_rows(BillOfMaterial, ('parent_sku_id', 'child_sku_id', 'quantity'), rows)
+
+    def load_campaigns(self):
+        # 9. fct_campaigns.csv
+        self.stdout.write('Loading Campaigns...')
+        place_map = self.maps['place']
+        rows = [
+            (
+                row['id'], place_map.get(row['place_id']),
+                row.get('title', 'Unknown'), row.get('discount_type', ''),
+                parse_decimal(row.get('value'), 2, 999999),
+            )
+            for row in self.read_csv('fct_campaigns.csv')
+        ]
+        insert_rows(Campaign, ('external_id', 'place_id', 'title', 'discount_type', 'value'), rows)
+
+    def load_orders(self):
+        # 10. fct_orders.csv
+        self.stdout.write('Loading Orders...')
+        # Orders already loaded are skipped by the unique external_id
+        df = self.read_frame('fct_orders.csv', ['id', 'place_id', 'user_id', 'status', 'total_amount', 'payment_method', 'created'])
+        df = pd.DataFrame({
+            'external_id': df['id'],
+            'place_id': map_column(df['place_id'], self.maps['place']),
+            'user_id': map_column(df['user_id'], self.maps['user']),
+            'status': df['status'],
+            'total_amount': parse_decimal_column(df['total_amount'], 2, 99999999),
+            'payment_method': df['payment_method'],
+            'created_at': parse_timestamp_column(df['created']),
+        })
+        count = insert_frame(Order, df)
+        self.stdout.write(f"  Inserted {count} orders")
+
+    def load_order_items(self):
+        # 11. fct_order_items.csv
+        self.stdout.write('Loading OrderItems (this is large)...')
+        df = self.read_frame('fct_order_items.csv', ['id', 'order_id', 'item_id', 'quantity', 'price'])
+        df = df.assign(order_id=map_column(df['order_id'], self.maps['order']))
+        df = df[df['order_id'].notna()]
+        df = pd.DataFrame({
+            'external_id': df['id'],
+            'order_id': df['order_id'],
+            'item_id': map_column(df['item_id'], self.maps['item']),
+            'quantity': parse_decimal_column(df['quantity'], 2, 999999),
+            'price': parse_decimal_column(df['price'], 2, 9999999),
+        })
+        count = insert_frame(OrderItem, df)
+        self.stdout.write(f"  Inserted {count} order items")
+
+    def load_menu_add_ons(self):
+        # 12. dim_menu_item_add_ons.csv
+        self.stdout.write('Loading Menu AddOn Definitions...')
+        rows = [
+            (
+                row['id'], row['title'], row['category_id'],
+                parse_decimal(row.get('price'), 2, 999999),
+                parse_bool(row['select_as_default']),
+                row['status'],
+            )
+            for row in self.read_csv('dim_menu_item_add_ons.csv')
+        ]
+        insert_rows(MenuItemAddOnDefinition, ('external_id', 'title', 'category_id_ref', 'price', 'select_as_default', 'status'), rows)
+
+        # 13. dim_menu_items.csv
+        self.stdout.write(f"Skipping dim_menu_items.csv (Redundant with Items)")
+
+    def load_invoice_items(self):
+        # 14. fct_invoice_items.csv
+        self.stdout.write('Loading Invoice Items...')
+        df = self.read_frame('fct_invoice_items.csv', ['id', 'user_id', 'amount', 'description', 'product_id', 'invoice_id'])
+        insert_frame(InvoiceItem, pd.DataFrame({
+            'external_id': df['id'],
+            'user_id': map_column(df['user_id'], self.maps['user']),
+            'amount': parse_decimal_column(df['amount'], 2, 99999999),
+            'description': df['description'],
+            'product_id': df['product_id'],
+            'invoice_id': df['invoice_id'],
+        }))
+
+    def load_cash_balances(self):
+        # 15. fct_cash_balances.csv
+        self.stdout.write('Loading Cash Balances...')
+        df = self.read_frame('fct_cash_balances.csv', ['id', 'place_id', 'opening_balance', 'closing_balance', 'status'])
+        insert_frame(CashBalance, pd.DataFrame({
+            'external_id': df['id'],
+            'place_id': map_column(df['place_id'], self.maps['place']),
+            'opening_balance': parse_decimal_column(df['opening_balance'], 2, 99999999),
+            'closing_balance': parse_decimal_column(df['closing_balance'], 2, 99999999),
+            'status': df['status'],
+        }))
+
+    def load_inventory_reports(self):
+        # 16. fct_inventory_reports.csv
+        self.stdout.write('Loading Inventory Reports...')
+        place_map = self.maps['place']
+        rows = [
+            (
+                row['id'], place_map.get(row['place_id']),
+                row.get('data'), row.get('excel'), row.get('pdf'),
+                parse_timestamp(row.get('start_time')),
+                parse_timestamp(row.get('end_time')),
+            )
+            for row in self.read_csv('fct_inventory_reports.csv')
+        ]
+        insert_rows(InventoryReport, ('external_id', 'place_id', 'data', 'excel', 'pdf', 'start_time', 'end_time'), rows)
+
+    def load_bonus_codes(self):
+        # 17. fct_bonus_codes.csv
+        self.stdout.write('Loading Bonus Codes...')
+        df = self.read_frame('fct_bonus_codes.csv', ['id', 'place_id', 'user_id', 'points', 'redemptions', 'start_date_time', 'end_date_time'])
+        insert_frame(BonusCode, pd.DataFrame({
+            'external_id': df['id'],
+            'place_id': map_column(df['place_id'], self.maps['place']),
+            'user_id': map_column(df['user_id'], self.maps['user']),
+            'points': parse_decimal_column(df['points'], 0, 999999).astype('int64'),
+            'redemptions': parse_decimal_column(df['redemptions'], 0, 999999).astype('int64'),
+            'start_date_time': parse_timestamp_column(df['start_date_time']),
+            'end_date_time': parse_timestamp_column(df['end_date_time']),
+        }))
+
+    def load_most_ordered(self):
+        # 18. most_ordered.csv
+        self.stdout.write('Loading Most Ordered Stats...')
+        place_map = self.maps['place']
+        # Fallback for unknown places, looked up once rather than per row
+        default_place_id = Place.objects.values_list('id', flat=True).first()
+        rows = [
+            (
+                place_map.get(row['place_id']) or default_place_id,
+                row['item_id'], row['item_name'],
+                parse_decimal(row['order_count'], 0, 999999),
+                row.get('store_address', ''),
+            )
+            for row in self.read_csv('most_ordered.csv')
+        ]
+        insert_rows(MostOrderedStat, ('place_id', 'item_id', 'item_name', 'order_count', 'store_address'), rows)
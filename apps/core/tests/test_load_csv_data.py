@@ -0,0 +1,133 @@
+"""
+Unit tests for the load_csv_data management command.
+
+Tests the CSV chunk readers and the order loaders.
+"""
+
+import io
+import os
+import shutil
+import tempfile
+from decimal import Decimal
+from unittest import skipIf
+from unittest.mock import patch
+
+import pandas as pd
+from django.test import SimpleTestCase, TestCase
+from django.utils import timezone
+
+from apps.core.management.commands.load_csv_data import Command, pa_csv
+from apps.core.models import Place
+from apps.sales.models import Order, OrderItem
+
+
+@skipIf(pa_csv is None, "pyarrow is not installed")
+class ReadChunksTestCase(SimpleTestCase):
+    """Tests that the pyarrow and pandas readers agree."""
+    
+    def setUp(self):
+        handle, self.path = tempfile.mkstemp(suffix='.csv')
+        with os.fdopen(handle, 'wb') as f:
+            f.write(
+                b'id,title,price,extra\n'
+                b'1,"Caf\xe9 \xc3\xa9",9.5,x\n'    # invalid UTF-8 byte
+                b'2,,3,"multi\nline"\n'
+                b'\n'
+                b'3,"a ""quoted"" title",,z\n'
+                b'4,None,NaN,\n'
+                b'5,NA,0,y\n'
+            )
+        self.addCleanup(os.remove, self.path)
+    
+    def test_readers_yield_same_chunks(self):
+        """Test both readers give the same all-string chunks."""
+        command = Command()
+        columns = ['id', 'title', 'price', 'missing']
+        
+        arrow = list(command.read_arrow_chunks(self.path, 2, columns))
+        pandas = list(command.read_pandas_chunks(self.path, 2, columns))
+        
+        self.assertEqual(len(arrow), 3)
+        self.assertEqual(len(arrow), len(pandas))
+        for arrow_chunk, pandas_chunk in zip(arrow, pandas):
+            self.assertEqual(list(arrow_chunk.columns), columns)
+            self.assertTrue((arrow_chunk.dtypes == object).all())
+            pd.testing.assert_frame_equal(
+                arrow_chunk.reset_index(drop=True),
+                pandas_chunk.reset_index(drop=True)
+            )
+        
+        rows = pd.concat(arrow, ignore_index=True)
+        self.assertEqual(rows.loc[0, 'title'], 'Caf� é')
+        self.assertEqual(list(rows['missing']), [''] * 5)
+        self.assertEqual(list(rows['title'][1:]), ['', 'a "quoted" title', 'None', 'NA'])
+    
+    def test_read_chunks_uses_arrow(self):
+        """Test read_chunks dispatches to the pyarrow reader when available."""
+        command = Command()
+        with patch.object(Command, 'read_pandas_chunks', side_effect=AssertionError):
+            chunks = list(command.read_chunks(self.path, 10, ['id']))
+        
+        self.assertEqual(len(chunks), 1)
+        self.assertEqual(list(chunks[0]['id']), ['1', '2', '3', '4', '5'])
+
+
+class CopyValueTestCase(SimpleTestCase):
+    """Tests the COPY text-format field values."""
+    
+    def test_json_boolean_and_null_values(self):
+        """Test JSON is written as JSON text, booleans as t/f and None as \\N."""
+        command = Command()
+        place = Place(
+            title="Tab\tPlace",
+            active=False,
+            opening_hours={'mon': "09:00\t17:00", 'open': True}
+        )
+        
+        def value(name):
+            return command.copy_value(Place._meta.get_field(name), place)
+        
+        self.assertEqual(value('opening_hours'), '{"mon": "09:00\\\\t17:00", "open": true}')
+        self.assertEqual(value('active'), 'f')
+        self.assertEqual(value('title'), 'Tab\\tPlace')
+        self.assertEqual(value('contact_email'), '\\N')
+
+
+class LoadOrdersTestCase(TestCase):
+    """Tests that the order loaders skip ids already used as external_id."""
+    
+    def setUp(self):
+        self.data_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.data_dir)
+        
+        # As load_data creates them: auto primary key, CSV id in external_id
+        place = Place.objects.create(title="Test Place", active=True)
+        self.order = Order.objects.create(
+            place=place,
+            status='Closed',
+            total_amount=Decimal("10.00"),
+            created_at=timezone.now(),
+            external_id='900'
+        )
+        OrderItem.objects.create(order=self.order, quantity=1, price=Decimal("1.00"), external_id='800')
+        created = int(timezone.now().timestamp())
+        
+        with open(os.path.join(self.data_dir, 'fct_orders.csv'), 'w') as f:
+            f.write('id,place_id,status,total_amount,payment_method,created\n')
+            f.write(f'900,{place.id},Closed,10.00,Card,{created}\n')
+            f.write(f'901,{place.id},Closed,12.50,Card,{created}\n')
+        with open(os.path.join(self.data_dir, 'fct_order_items.csv'), 'w') as f:
+            f.write('id,order_id,item_id,quantity,price\n')
+            f.write('800,901,,1,2.00\n')
+            f.write('801,901,,2,2.00\n')
+    
+    def test_external_id_collisions_are_skipped(self):
+        """Test rows whose id is another row's external_id are skipped, not fatal."""
+        command = Command(stdout=io.StringIO())
+        command.load_orders(self.data_dir)
+        command.load_order_items(self.data_dir)
+        
+        self.assertEqual(Order.objects.filter(external_id='900').get(), self.order)
+        self.assertTrue(Order.objects.filter(pk=901, external_id='901').exists())
+        self.assertEqual(OrderItem.objects.filter(external_id='800').get().order, self.order)
+        self.assertTrue(OrderItem.objects.filter(pk=801, order_id=901).exists())
@@ -3,3 +3,6 @@ from django.apps import AppConfig
 class IntelligenceConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.intelligence'
+
+    def ready(self):
+        from apps.intelligence import signals  # noqa: F401
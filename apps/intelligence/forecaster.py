@@ -20,17 +20,76 @@ Usage:
 """
 
 import logging
+import multiprocessing
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
 from typing import Optional, Dict, List, Any
 
 import numpy as np
 import pandas as pd
-from django.db.models import Sum, Count
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import Q, Sum
 from django.db.models.functions import TruncDate
 from django.utils import timezone
 
 logger = logging.getLogger(__name__)
 
+def warm_start_params(model) -> Dict[str, Any]:
+    """
+    Initial Stan parameters taken from a fitted Prophet model.
+    
+    Passing these as fit(init=...) lets L-BFGS start next to the previous
+    optimum instead of from scratch.
+    """
+    params = {}
+    for name in ['k', 'm', 'sigma_obs']:
+        if model.mcmc_samples == 0:
+            params[name] = model.params[name][0][0]
+        else:
+            params[name] = np.mean(model.params[name])
+    for name in ['delta', 'beta']:
+        if model.mcmc_samples == 0:
+            params[name] = model.params[name][0]
+        else:
+            params[name] = np.mean(model.params[name], axis=0)
+    return params
+
+
+def _lag(y: np.ndarray, periods: int) -> np.ndarray:
+    """y shifted forward by periods, NaN-padded (like Series.shift)."""
+    lagged = np.full(len(y), np.nan)
+    lagged[periods:] = y[:-periods]
+    return lagged
+
+
+def _rolling_mean_std(y: np.ndarray, window: int):
+    """
+    Trailing-window mean and sample std with min_periods=1, from running sums.
+    
+    Works on y centred on its mean to keep the sum-of-squares difference
+    numerically stable. Matches Series.rolling(window, min_periods=1).
+    """
+    offset = y.mean() if len(y) else 0.0
+    centred = y - offset
+    sums = np.concatenate(([0.0], np.cumsum(centred)))
+    squares = np.concatenate(([0.0], np.cumsum(centred * centred)))
+    
+    end = np.arange(1, len(y) + 1)
+    start = np.maximum(end - window, 0)
+    count = end - start
+    total = sums[end] - sums[start]
+    total_sq = squares[end] - squares[start]
+    
+    mean = total / count + offset
+    with np.errstate(divide='ignore', invalid='ignore'):
+        var = (total_sq - total * total / count) / (count - 1)
+    std = np.sqrt(np.maximum(var, 0))
+    std[count < 2] = np.nan
+    return mean, std
+
 
 class DemandForecaster:
     """
@@ -49,7 +108,13 @@ class DemandForecaster:
         training_data (pd.DataFrame): DataFrame used for training (ds, y)
     """
     
-    def __init__(self, place_id: int, item_id: Optional[int] = None, use_csv: bool = False):
+    def __init__(
+        self,
+        place_id: int,
+        item_id: Optional[int] = None,
+        use_csv: bool = False,
+        training_df: Optional[pd.DataFrame] = None
+    ):
         """
         Initialize the forecaster.
         
@@ -57,12 +122,16 @@ class DemandForecaster:
             place_id: The place/location ID to forecast for
             item_id: Optional item ID for item-specific forecasting
             use_csv: Deprecated. Kept for compatibility but ignored.
+            training_df: Optional pre-aggregated sales (ds, y), e.g. from
+                bulk_aggregate(). Used instead of querying the database
+                when no explicit date range is requested.
         """
         self.place_id = place_id
         self.item_id = item_id
         # use_csv is deprecated as we now strictly use the database
         self.model = None
         self.training_data = None
+        self._training_df = training_df
         self.metrics = {}
         self._prophet_available = self._check_prophet_available()
     
@@ -93,52 +162,154 @@ class DemandForecaster:
         Returns:
             DataFrame with columns 'ds' (date) and 'y' (quantity)
         """
-        df = self._aggregate_from_db(start_date, end_date)
+        if self._training_df is not None and start_date is None and end_date is None:
+            df = self._training_df
+        else:
+            df = self._aggregate_from_db(start_date, end_date)
         self.training_data = df
         return df
 
+    @classmethod
+    def bulk_aggregate(
+        cls,
+        place_id: int,
+        item_ids: List[int],
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None
+    ) -> Dict[int, pd.DataFrame]:
+        """
+        Aggregate daily sales for several items of a place in one query.
+        
+        Args:
+            place_id: The place/location ID
+            item_ids: Items to aggregate
+            start_date: Start of data range (auto-detected per item if None)
+            end_date: End of data range (auto-detected per item if None)
+            
+        Returns:
+            Dict of item_id -> DataFrame shaped like aggregate_sales_data();
+            items without sales map to an empty DataFrame
+        
+        Note:
+            The auto-detected 365-day window is applied to whole days, so the
+            first day counts all of its sales rather than only those after the
+            time of the latest order.
+        """
+        from apps.sales.models import Order, OrderItem
+        
+        queryset = OrderItem.objects.filter(
+            order__place_id=place_id,
+            order__status=Order.CLOSED,
+            item_id__in=item_ids
+        )
+        if start_date is not None:
+            queryset = queryset.filter(order__created_at__gte=start_date)
+        if end_date is not None:
+            queryset = queryset.filter(order__created_at__lte=end_date)
+        
+        daily_sales = queryset.annotate(
+            date=TruncDate('order__created_at')
+        ).values('item_id', 'date').annotate(
+            total_quantity=Sum('quantity')
+        ).order_by('item_id', 'date').values_list('item_id', 'date', 'total_quantity')
+        
+        results = {item_id: pd.DataFrame(columns=['ds', 'y']) for item_id in item_ids}
+        rows = list(daily_sales)
+        if not rows:
+            logger.warning(f"No sales data found in DB for place_id={place_id}")
+            return results
+        
+        row_item_ids, dates, quantities = zip(*rows)
+        data = pd.DataFrame({
+            'item_id': np.asarray(row_item_ids, dtype=np.int64),
+            'ds': pd.to_datetime(dates),
+            'y': np.asarray(quantities, dtype=np.float32),
+        })
+        
+        for item_id, df in data.groupby('item_id', sort=False):
+            df = df.drop(columns='item_id')
+            # Same defaults as _aggregate_from_db, resolved on whole days
+            end = end_date if end_date is not None else df['ds'].max()
+            if start_date is not None:
+                start = start_date
+            else:
+                start = max(df['ds'].min(), end - timedelta(days=365))
+                df = df[df['ds'] >= start]
+            results[item_id] = cls._fill_missing_dates(df.reset_index(drop=True), start, end)
+        
+        logger.info(f"Aggregated sales for {len(data['item_id'].unique())} items from DB")
+        
+        return results
+
     # CSV aggregation methods removed as we now use DB exclusively
     
-    def _aggregate_from_db(
+    def _sales_queryset(self):
+        """Closed order lines for this place (and item, if set)."""
+        from apps.sales.models import Order, OrderItem
+        
+        queryset = OrderItem.objects.filter(
+            order__place_id=self.place_id,
+            order__status=Order.CLOSED
+        )
+        if self.item_id:
+            queryset = queryset.filter(item_id=self.item_id)
+        return queryset
+    
+    def _resolve_date_range(
         self,
         start_date: Optional[datetime] = None,
         end_date: Optional[datetime] = None
-    ) -> pd.DataFrame:
-        """Aggregate sales data from database."""
-        from apps.sales.models import OrderItem
+    ) -> Optional[tuple]:
+        """
+        Fill in a missing start/end date from the actual sales data.
+        
+        Returns:
+            (start_date, end_date), or None if there are no sales to detect from
+        """
         from django.db.models import Min, Max
         
-        # Build base queryset
-        base_queryset = OrderItem.objects.filter(
-            order__place_id=self.place_id,
-            order__status__icontains='Closed'
-        )
-        if self.item_id:
-            base_queryset = base_queryset.filter(item_id=self.item_id)
+        if start_date is not None and end_date is not None:
+            return start_date, end_date
         
-        # Auto-detect date range from actual data if not specified
-        if start_date is None or end_date is None:
-            date_range = base_queryset.aggregate(
-                min_date=Min('order__created_at'),
-                max_date=Max('order__created_at')
+        date_range = self._sales_queryset().aggregate(
+            min_date=Min('order__created_at'),
+            max_date=Max('order__created_at')
+        )
+        if date_range['max_date'] is None:
+            return None
+        
+        # Use actual data date range (last 365 days of data or all data if less)
+        if end_date is None:
+            end_date = date_range['max_date']
+        if start_date is None:
+            # Use last 365 days of data or all available
+            start_date = max(
+                date_range['min_date'],
+                end_date - timedelta(days=365)
             )
-            
-            if date_range['max_date'] is None:
-                logger.warning(f"No sales data found in DB for place_id={self.place_id}")
-                return pd.DataFrame(columns=['ds', 'y'])
-            
-            # Use actual data date range (last 365 days of data or all data if less)
-            if end_date is None:
-                end_date = date_range['max_date']
-            if start_date is None:
-                # Use last 365 days of data or all available
-                start_date = max(
-                    date_range['min_date'],
-                    end_date - timedelta(days=365)
-                )
+        return start_date, end_date
+    
+    @staticmethod
+    def _span_days(start_date: datetime, end_date: datetime) -> int:
+        """Number of calendar days _fill_missing_dates produces for a range."""
+        start = start_date.date() if hasattr(start_date, 'date') else start_date
+        end = end_date.date() if hasattr(end_date, 'date') else end_date
+        return max((end - start).days + 1, 0)
+    
+    def _aggregate_from_db(
+        self,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None
+    ) -> pd.DataFrame:
+        """Aggregate sales data from database."""
+        date_range = self._resolve_date_range(start_date, end_date)
+        if date_range is None:
+            logger.warning(f"No sales data found in DB for place_id={self.place_id}")
+            return pd.DataFrame(columns=['ds', 'y'])
+        start_date, end_date = date_range
         
         # Now filter by date range
-        queryset = base_queryset.filter(
+        queryset = self._sales_queryset().filter(
             order__created_at__gte=start_date,
             order__created_at__lte=end_date
         )
@@ -146,20 +317,21 @@ class DemandForecaster:
         daily_sales = queryset.annotate(
             date=TruncDate('order__created_at')
         ).values('date').annotate(
-            total_quantity=Sum('quantity'),
-            order_count=Count('order', distinct=True)
-        ).order_by('date')
+            total_quantity=Sum('quantity')
+        ).order_by('date').values_list('date', 'total_quantity')
         
-        # Convert to DataFrame
-        data = list(daily_sales)
-        if not data:
+        # Convert to DataFrame from plain tuples, one array per column
+        rows = list(daily_sales)
+        if not rows:
             logger.warning(f"No sales data found in DB for place_id={self.place_id}")
             return pd.DataFrame(columns=['ds', 'y'])
         
-        df = pd.DataFrame(data)
-        df = df.rename(columns={'date': 'ds', 'total_quantity': 'y'})
-        df['ds'] = pd.to_datetime(df['ds'])
-        df['y'] = df['y'].astype(float)
+        dates, quantities = zip(*rows)
+        df = pd.DataFrame({
+            'ds': pd.to_datetime(dates),
+            # float32 is plenty for daily quantities and halves the series' memory
+            'y': np.asarray(quantities, dtype=np.float32),
+        })
         
         # Fill missing dates with zeros
         df = self._fill_missing_dates(df, start_date, end_date)
@@ -168,8 +340,8 @@ class DemandForecaster:
         
         return df
     
+    @staticmethod
     def _fill_missing_dates(
-        self, 
         df: pd.DataFrame, 
         start_date: datetime, 
         end_date: datetime
@@ -185,18 +357,29 @@ class DemandForecaster:
         # Create complete date range
         date_range = pd.date_range(start=start, end=end, freq='D')
         
-        # Reindex to fill missing dates
-        df = df.set_index('ds')
-        df = df.reindex(date_range, fill_value=0)
-        df = df.reset_index()
-        df = df.rename(columns={'index': 'ds'})
+        # Scatter each day's values into zero-filled arrays by day offset
+        days = date_range.values.astype('datetime64[D]')
+        if len(days):
+            pos = (df['ds'].values.astype('datetime64[D]') - days[0]).astype(np.int64)
+        else:
+            pos = np.empty(len(df), dtype=np.int64)
+        keep = (pos >= 0) & (pos < len(days))
+        pos = pos[keep]
+        
+        filled = {'ds': date_range}
+        for col in df.columns.drop('ds'):
+            values = df[col].to_numpy()[keep]
+            column = np.zeros(len(days), dtype=np.float64 if values.dtype == object else values.dtype)
+            column[pos] = values
+            filled[col] = column
         
         # Ensure y column exists and is numeric
-        if 'y' not in df.columns:
-            df['y'] = 0
-        df['y'] = df['y'].fillna(0).astype(float)
+        if 'y' in filled:
+            filled['y'] = filled['y'].astype(np.float32, copy=False)
+        else:
+            filled['y'] = np.zeros(len(days), dtype=np.float32)
         
-        return df
+        return pd.DataFrame(filled)
     
     def add_features(self, df: pd.DataFrame) -> pd.DataFrame:
         """
@@ -215,23 +398,34 @@ class DemandForecaster:
         """
         df = df.copy()
         
-        # Basic temporal features
-        df['day_of_week'] = df['ds'].dt.dayofweek
-        df['is_weekend'] = df['day_of_week'].isin([5, 6]).astype(int)
-        df['month'] = df['ds'].dt.month
-        df['quarter'] = df['ds'].dt.quarter
-        df['day_of_month'] = df['ds'].dt.day
-        df['week_of_year'] = df['ds'].dt.isocalendar().week
-        
-        # Lag features (if enough data)
+        # Basic temporal features, all derived from one datetime64[D] array
+        days = df['ds'].to_numpy(dtype='datetime64[ns]').astype('datetime64[D]')
+        day_of_week = (days.view(np.int64) + 3) % 7  # 1970-01-01 was a Thursday
+        month_start = days.astype('datetime64[M]')
+        month = (month_start - days.astype('datetime64[Y]')).astype(np.int64) + 1
+        # ISO week: count weeks from Jan 1 of the year holding this week's Thursday
+        thursday = days - day_of_week + 3
+        iso_year_start = thursday.astype('datetime64[Y]').astype('datetime64[D]')
+        
+        df['day_of_week'] = day_of_week
+        df['is_weekend'] = (day_of_week >= 5).astype(int)
+        df['month'] = month
+        df['quarter'] = (month - 1) // 3 + 1
+        df['day_of_month'] = (days - month_start).astype(np.int64) + 1
+        df['week_of_year'] = (thursday - iso_year_start).astype(np.int64) // 7 + 1
+        
+        # Lag features (if enough data), computed in float64 and stored as float32
+        y = df['y'].to_numpy(dtype=np.float64)
         if len(df) > 7:
-            df['lag_7'] = df['y'].shift(7)
-            df['rolling_mean_7'] = df['y'].rolling(window=7, min_periods=1).mean()
-            df['rolling_std_7'] = df['y'].rolling(window=7, min_periods=1).std()
+            mean_7, std_7 = _rolling_mean_std(y, 7)
+            df['lag_7'] = _lag(y, 7).astype(np.float32)
+            df['rolling_mean_7'] = mean_7.astype(np.float32)
+            df['rolling_std_7'] = std_7.astype(np.float32)
         
         if len(df) > 30:
-            df['lag_30'] = df['y'].shift(30)
-            df['rolling_mean_30'] = df['y'].rolling(window=30, min_periods=1).mean()
+            mean_30, _ = _rolling_mean_std(y, 30)
+            df['lag_30'] = _lag(y, 30).astype(np.float32)
+            df['rolling_mean_30'] = mean_30.astype(np.float32)
         
         return df
     
@@ -257,6 +451,16 @@ class DemandForecaster:
         
         from prophet import Prophet
         
+        # Short-circuit on too short a history using only the Min/Max lookup,
+        # before running the daily aggregation and date fill
+        if self._training_df is None:
+            date_range = self._resolve_date_range(start_date, end_date)
+            days = self._span_days(*date_range) if date_range else 0
+            if days < 14:
+                logger.error(f"Insufficient data for training (need at least 14 days, got {days})")
+                return {'error': 'Insufficient data', 'data_points': days}
+            start_date, end_date = date_range
+        
         # Get training data
         df = self.aggregate_sales_data(start_date, end_date)
         
@@ -271,15 +475,28 @@ class DemandForecaster:
             'daily_seasonality': False,
             'changepoint_prior_scale': 0.05,
             'seasonality_prior_scale': 10,
+            # Intervals are derived from sigma_obs in _predict_prophet, so skip
+            # the Monte Carlo sampling that dominates predict() time
+            'uncertainty_samples': 0,
         }
         default_params.update(prophet_kwargs)
         
         # Initialize and train Prophet
         self.model = Prophet(**default_params)
         
-        # Fit model
+        # Fit model, warm-started from the last fit when it still applies
         logger.info(f"Training Prophet model on {len(df)} data points")
-        self.model.fit(df[['ds', 'y']])
+        previous = self._load_cached_model()
+        if previous is not None and self._can_warm_start(previous, df, default_params):
+            try:
+                self.model.fit(df[['ds', 'y']], init=warm_start_params(previous))
+            except Exception as e:
+                logger.warning(f"Warm start failed ({e}), refitting from scratch")
+                self.model = Prophet(**default_params)
+                self.model.fit(df[['ds', 'y']])
+        else:
+            self.model.fit(df[['ds', 'y']])
+        self._save_cached_model()
         
         # Calculate cross-validation metrics
         self.metrics = self._calculate_metrics(df)
@@ -295,6 +512,51 @@ class DemandForecaster:
             'model_params': default_params
         }
     
+    def _cache_path(self) -> str:
+        """File holding the last fitted model for this place/item."""
+        item = self.item_id if self.item_id else 'all'
+        return os.path.join(settings.FORECAST_MODEL_CACHE_DIR, f'{self.place_id}_{item}.json')
+    
+    def _load_cached_model(self):
+        """Load the previously fitted Prophet model, or None."""
+        path = self._cache_path()
+        if not os.path.exists(path):
+            return None
+        
+        from prophet.serialize import model_from_json
+        try:
+            with open(path) as f:
+                return model_from_json(f.read())
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable cached model {path}: {e}")
+            return None
+    
+    def _save_cached_model(self) -> None:
+        """Persist the fitted model for warm-starting the next refit."""
+        from prophet.serialize import model_to_json
+        path = self._cache_path()
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            # Write beside the target and swap it in, so concurrent runs for
+            # the same place/item never read a half-written file
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'w') as f:
+                    f.write(model_to_json(self.model))
+                os.replace(tmp_path, path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError as e:
+            logger.warning(f"Could not cache fitted model: {e}")
+    
+    @staticmethod
+    def _can_warm_start(previous, df: pd.DataFrame, params: Dict[str, Any]) -> bool:
+        """A previous fit is reusable if its history overlaps and its config matches."""
+        if previous.history['ds'].max() < df['ds'].min():
+            return False
+        return all(getattr(previous, name, None) == value for name, value in params.items())
+    
     def _train_fallback(
         self, 
         start_date: Optional[datetime] = None,
@@ -309,11 +571,19 @@ class DemandForecaster:
         if df.empty:
             return {'error': 'No data available', 'data_points': 0}
         
-        # Store simple statistics for fallback prediction
+        # Weekday means in one bincount pass; weekdays with no rows are left
+        # out so predictions fall back to the overall mean for them
+        dow = df['ds'].dt.dayofweek.to_numpy()
+        y = df['y'].to_numpy(dtype=np.float64)
+        sums = np.bincount(dow, weights=y, minlength=7)
+        counts = np.bincount(dow, minlength=7)
+        weekly_pattern = {int(i): float(sums[i] / counts[i]) for i in np.flatnonzero(counts)}
+        
+        # Store simple statistics for fallback prediction (float64 for accuracy)
         self.metrics = {
-            'mean': float(df['y'].mean()),
-            'std': float(df['y'].std()) if len(df) > 1 else 0,
-            'weekly_pattern': df.groupby(df['ds'].dt.dayofweek)['y'].mean().to_dict()
+            'mean': float(y.mean()),
+            'std': float(y.std(ddof=1)) if len(df) > 1 else 0,
+            'weekly_pattern': weekly_pattern
         }
         
         logger.info(f"Using fallback (moving average) forecaster with {len(df)} data points")
@@ -367,179 +637,280 @@ class DemandForecaster:
         # Generate predictions
         forecast = self.model.predict(future)
         
-        # Select relevant columns and rename
-        cols_to_select = ['ds', 'yhat', 'yhat_lower', 'yhat_upper', 'trend']
-        if 'weekly' in forecast.columns:
-            cols_to_select.append('weekly')
-        
-        result = forecast[cols_to_select].copy()
-        
-        result = result.rename(columns={
-            'yhat': 'predicted_quantity',
-            'yhat_lower': 'lower_bound_80',
-            'yhat_upper': 'upper_bound_80',
-        })
-        
-        if 'weekly' in result.columns:
-            result = result.rename(columns={'weekly': 'weekly_seasonality'})
+        # Pull the columns out as arrays once and post-process them in place
+        yhat, trend = forecast[['yhat', 'trend']].to_numpy(dtype=np.float64).T.copy()
+        weekly = forecast['weekly'].to_numpy() if 'weekly' in forecast.columns else 0
+        
+        if 'yhat_lower' in forecast.columns:
+            # Sampled intervals (uncertainty_samples re-enabled by the caller);
+            # 95% is widened from the 80% band
+            lower, upper = forecast[['yhat_lower', 'yhat_upper']].to_numpy(dtype=np.float64).T.copy()
+            half_width = 1.5 * (upper - yhat)
+            lower_95 = yhat - half_width
+            upper_95 = yhat + half_width
         else:
-            result['weekly_seasonality'] = 0
-        
-        # Add 95% confidence intervals (wider than default 80%)
-        interval_width = result['upper_bound_80'] - result['predicted_quantity']
-        result['lower_bound_95'] = result['predicted_quantity'] - (interval_width * 1.5)
-        result['upper_bound_95'] = result['predicted_quantity'] + (interval_width * 1.5)
+            # Normal intervals from the fitted observation noise
+            sigma = self._observation_sigma()
+            lower = yhat - 1.2816 * sigma
+            upper = yhat + 1.2816 * sigma
+            lower_95 = yhat - 1.96 * sigma
+            upper_95 = yhat + 1.96 * sigma
         
         # Ensure non-negative predictions
-        for col in ['predicted_quantity', 'lower_bound_80', 'lower_bound_95']:
-            result[col] = result[col].clip(lower=0)
-        
-        return result
+        np.maximum(yhat, 0, out=yhat)
+        np.maximum(lower, 0, out=lower)
+        np.maximum(lower_95, 0, out=lower_95)
+        
+        return pd.DataFrame({
+            'ds': forecast['ds'].to_numpy(),
+            'predicted_quantity': yhat,
+            'lower_bound_80': lower,
+            'upper_bound_80': upper,
+            'trend': trend,
+            'weekly_seasonality': weekly,
+            'lower_bound_95': lower_95,
+            'upper_bound_95': upper_95,
+        })
+    
+    def _observation_sigma(self) -> float:
+        """Prophet's fitted noise std (sigma_obs), in the units of y."""
+        sigma = float(np.mean(self.model.params['sigma_obs']))
+        return sigma * float(getattr(self.model, 'y_scale', 1.0) or 1.0)
     
     def _predict_fallback(self, days_ahead: int) -> pd.DataFrame:
         """Generate predictions using simple moving average."""
         base_date = timezone.now().date()
-        dates = [base_date + timedelta(days=i) for i in range(days_ahead)]
+        dates = pd.date_range(start=base_date, periods=days_ahead, freq='D')
         
-        predictions = []
-        for date in dates:
-            day_of_week = date.weekday()
-            
-            # Use weekly pattern if available
-            if 'weekly_pattern' in self.metrics:
-                base_pred = self.metrics['weekly_pattern'].get(
-                    day_of_week, 
-                    self.metrics['mean']
-                )
-            else:
-                base_pred = self.metrics['mean']
-            
-            std = self.metrics.get('std', base_pred * 0.2)
-            
-            predictions.append({
-                'ds': date,
-                'predicted_quantity': base_pred,
-                'lower_bound_80': max(0, base_pred - std),
-                'upper_bound_80': base_pred + std,
-                'lower_bound_95': max(0, base_pred - 1.5 * std),
-                'upper_bound_95': base_pred + 1.5 * std,
-                'trend': base_pred,
-                'weekly_seasonality': 0
-            })
+        # Use weekly pattern if available: a 7-slot table indexed by weekday
+        mean = self.metrics['mean']
+        pattern = self.metrics.get('weekly_pattern', {})
+        weekly = np.array([pattern.get(day, mean) for day in range(7)], dtype=np.float64)
+        base_pred = weekly[dates.weekday]
         
-        return pd.DataFrame(predictions)
+        if 'std' in self.metrics:
+            std = np.full(days_ahead, self.metrics['std'], dtype=np.float64)
+        else:
+            std = base_pred * 0.2
+        
+        return pd.DataFrame({
+            'ds': dates,
+            'predicted_quantity': base_pred,
+            'lower_bound_80': np.maximum(0, base_pred - std),
+            'upper_bound_80': base_pred + std,
+            'lower_bound_95': np.maximum(0, base_pred - 1.5 * std),
+            'upper_bound_95': base_pred + 1.5 * std,
+            'trend': base_pred,
+            'weekly_seasonality': 0
+        })
     
     def _calculate_metrics(self, df: pd.DataFrame) -> Dict[str, float]:
         """
         Calculate accuracy metrics on training data.
         
-        Uses simple train/test split for quick validation.
+        Scores the fitted model's in-sample predictions against the actuals,
+        so no second model has to be fitted.
         """
         if len(df) < 21:
             return {'note': 'Insufficient data for metrics'}
         
-        # Use last 7 days as test set
-        train = df.iloc[:-7]
-        test = df.iloc[-7:]
-        
-        # Fit temporary model on train set
-        from prophet import Prophet
-        temp_model = Prophet(
-            yearly_seasonality=False,
-            weekly_seasonality=True,
-            daily_seasonality=False
-        )
-        temp_model.fit(train[['ds', 'y']])
-        
-        # Predict on test dates
-        future = temp_model.make_future_dataframe(periods=7, include_history=False)
-        forecast = temp_model.predict(future)
+        forecast = self.model.predict(df[['ds']])
         
         # Calculate metrics
-        y_true = test['y'].values
-        y_pred = forecast['yhat'].values
+        y_true = df['y'].to_numpy(dtype=float)
+        y_pred = forecast['yhat'].to_numpy(dtype=float)
+        errors = y_true - y_pred
         
         # MAPE (handling zeros)
         mask = y_true != 0
-        if mask.sum() > 0:
-            mape = np.mean(np.abs((y_true[mask] - y_pred[mask]) / y_true[mask])) * 100
+        if mask.any():
+            mape = np.mean(np.abs(errors[mask] / y_true[mask])) * 100
         else:
             mape = None
         
         # RMSE
-        rmse = np.sqrt(np.mean((y_true - y_pred) ** 2))
+        rmse = np.sqrt(np.mean(errors ** 2))
         
         # MAE
-        mae = np.mean(np.abs(y_true - y_pred))
+        mae = np.mean(np.abs(errors))
         
         return {
-            'mape': round(mape, 2) if mape else None,
+            'mape': round(mape, 2) if mape is not None else None,
             'rmse': round(rmse, 2),
             'mae': round(mae, 2)
         }
     
-    def save_forecasts(self, forecasts: pd.DataFrame) -> int:
-        """
-        Save forecasts to database.
-        
-        Args:
-            forecasts: DataFrame from predict() method
-            
-        Returns:
-            Number of forecasts saved
-        """
-        from apps.intelligence.models import DemandForecast, ForecastModel
-        from apps.core.models import Place
-        from apps.inventory.models import Item
-        
-        # Get or create ForecastModel record
-        place = Place.objects.get(pk=self.place_id)
-        item = Item.objects.get(pk=self.item_id) if self.item_id else None
+    def build_forecast_model(self, place, item):
+        """Unsaved ForecastModel row describing this training run."""
+        from apps.intelligence.models import ForecastModel
         
         training_data = self.training_data
+        has_data = training_data is not None and not training_data.empty
         
-        forecast_model = ForecastModel.objects.create(
+        return ForecastModel(
             place=place,
             item=item,
             mape=self.metrics.get('mape'),
             rmse=self.metrics.get('rmse'),
             mae=self.metrics.get('mae'),
-            training_start_date=training_data['ds'].min().date() if training_data is not None and not training_data.empty else timezone.now().date(),
-            training_end_date=training_data['ds'].max().date() if training_data is not None and not training_data.empty else timezone.now().date(),
+            training_start_date=training_data['ds'].min().date() if has_data else timezone.now().date(),
+            training_end_date=training_data['ds'].max().date() if has_data else timezone.now().date(),
             data_points_used=len(training_data) if training_data is not None else 0,
             model_params={'type': 'prophet' if self._prophet_available else 'fallback'}
         )
-        
-        # Create forecast records
-        forecast_objects = []
-        for _, row in forecasts.iterrows():
-            forecast_objects.append(DemandForecast(
+    
+    def build_forecasts(self, forecasts: pd.DataFrame, forecast_model, place, item) -> list:
+        """Unsaved DemandForecast rows for a predict() DataFrame."""
+        from apps.intelligence.models import DemandForecast
+        
+        # Zip whole columns instead of iterrows()
+        def column(name):
+            if name in forecasts.columns:
+                return forecasts[name].astype(float).tolist()
+            return [None] * len(forecasts)
+        
+        return [
+            DemandForecast(
                 forecast_model=forecast_model,
                 place=place,
                 item=item,
-                forecast_date=row['ds'].date() if hasattr(row['ds'], 'date') else row['ds'],
-                predicted_quantity=row['predicted_quantity'],
-                lower_bound_80=row.get('lower_bound_80'),
-                upper_bound_80=row.get('upper_bound_80'),
-                lower_bound_95=row.get('lower_bound_95'),
-                upper_bound_95=row.get('upper_bound_95'),
-                trend=row.get('trend'),
-                weekly_seasonality=row.get('weekly_seasonality')
-            ))
-        
-        DemandForecast.objects.bulk_create(forecast_objects)
-        logger.info(f"Saved {len(forecast_objects)} forecasts to database")
-        
-        return len(forecast_objects)
+                forecast_date=ds,
+                predicted_quantity=pq,
+                lower_bound_80=l80,
+                upper_bound_80=u80,
+                lower_bound_95=l95,
+                upper_bound_95=u95,
+                trend=tr,
+                weekly_seasonality=ws
+            )
+            for ds, pq, l80, u80, l95, u95, tr, ws in zip(
+                pd.to_datetime(forecasts['ds']).dt.date,
+                column('predicted_quantity'),
+                column('lower_bound_80'),
+                column('upper_bound_80'),
+                column('lower_bound_95'),
+                column('upper_bound_95'),
+                column('trend'),
+                column('weekly_seasonality'),
+            )
+        ]
+    
+    def save_forecasts(self, forecasts: pd.DataFrame) -> int:
+        """
+        Save forecasts to database.
+        
+        Args:
+            forecasts: DataFrame from predict() method
+            
+        Returns:
+            Number of forecasts saved
+        """
+        return save_forecast_batch([(self, forecasts)])[0]
 
 
+def save_forecast_batch(batch: List[tuple]) -> List[int]:
+    """
+    Save the forecasts of several trained forecasters in one transaction.
+    
+    Args:
+        batch: (forecaster, forecasts DataFrame) pairs
+        
+    Returns:
+        Number of forecasts saved for each pair
+    """
+    from django.core.cache import cache
+    from apps.intelligence.models import DemandForecast, ForecastModel
+    from apps.intelligence.signals import active_model_cache_key
+    from apps.core.models import Place
+    from apps.inventory.models import Item
+    
+    # Fetch every Place and Item once instead of per forecaster
+    places = Place.objects.in_bulk({forecaster.place_id for forecaster, _ in batch})
+    items = Item.objects.in_bulk({forecaster.item_id for forecaster, _ in batch if forecaster.item_id})
+    
+    with transaction.atomic():
+        rows = []
+        for forecaster, forecasts in batch:
+            if forecaster.place_id not in places:
+                raise Place.DoesNotExist(f"Place {forecaster.place_id} does not exist")
+            if forecaster.item_id and forecaster.item_id not in items:
+                raise Item.DoesNotExist(f"Item {forecaster.item_id} does not exist")
+            place = places[forecaster.place_id]
+            item = items[forecaster.item_id] if forecaster.item_id else None
+            rows.append((forecaster, forecasts, place, item, forecaster.build_forecast_model(place, item)))
+        
+        # The new models replace whatever was active for the same place/item;
+        # retire those in one UPDATE
+        if rows:
+            replaced = Q()
+            for forecaster, _, _, _, _ in rows:
+                replaced |= Q(place_id=forecaster.place_id, item_id=forecaster.item_id or None)
+            ForecastModel.objects.filter(replaced, is_active=True).update(is_active=False)
+        
+        # One INSERT for all ForecastModel rows; their ids are needed below
+        forecast_models = [row[4] for row in rows]
+        if connection.features.can_return_rows_from_bulk_insert:
+            ForecastModel.objects.bulk_create(forecast_models)
+        else:
+            for forecast_model in forecast_models:
+                forecast_model.save()
+                # save() leaves the db_default expression on the instance
+                forecast_model.refresh_from_db(fields=['training_date'])
+        
+        counts = []
+        forecast_objects = []
+        for forecaster, forecasts, place, item, forecast_model in rows:
+            built = forecaster.build_forecasts(forecasts, forecast_model, place, item)
+            counts.append(len(built))
+            forecast_objects.extend(built)
+        
+        # 1000 rows x 13 columns stays well under PostgreSQL's 65535 parameter limit
+        DemandForecast.objects.bulk_create(forecast_objects, batch_size=1000)
+        
+        # Bulk writes send no signals; drop the views' cached active models
+        # once the new ones are visible
+        stale_keys = [
+            active_model_cache_key(forecaster.place_id, forecaster.item_id)
+            for forecaster, _, _, _, _ in rows
+        ]
+        transaction.on_commit(lambda: cache.delete_many(stale_keys))
+    
+    logger.info(f"Saved {len(forecast_objects)} forecasts to database")
+    
+    return counts
+
 
+def _fit_predict_one(
+    place_id: int,
+    item_id: int,
+    days_ahead: int,
+    df_slice: pd.DataFrame
+):
+    """
+    Train and predict a single item from pre-aggregated sales.
+    
+    Module-level so it can run in a worker process. It never queries the
+    database: forked workers share the parent's connections, which may be
+    inside an open transaction, so they must be left alone. Returns
+    (train_result, forecaster, predictions); the last two are None when
+    training failed. The fitted model is dropped before returning since
+    save_forecasts() doesn't need it and it is costly to pickle.
+    """
+    forecaster = DemandForecaster(place_id, item_id, use_csv=False, training_df=df_slice)
+    train_result = forecaster.train()
+    if 'error' in train_result:
+        return train_result, None, None
+    
+    predictions = forecaster.predict(days_ahead=days_ahead)
+    forecaster.model = None
+    return train_result, forecaster, predictions
 
 
 def generate_forecasts_for_place(
     place_id: int, 
     days_ahead: int = 7,
-    item_ids: Optional[List[int]] = None
+    item_ids: Optional[List[int]] = None,
+    workers: int = 1
 ) -> Dict[str, Any]:
     """
     Convenience function to generate and save forecasts.
@@ -548,6 +919,9 @@ def generate_forecasts_for_place(
         place_id: Place to forecast for
         days_ahead: Forecast horizon
         item_ids: Optional list of specific items to forecast
+        workers: Processes to fit items in. Above 1, forks a pool, so only
+            pass it from batch jobs such as the generate_forecasts command,
+            not from web requests or task workers
         
     Returns:
         Summary of generation results
@@ -555,14 +929,33 @@ def generate_forecasts_for_place(
     results = {'place_id': place_id, 'forecasts': []}
     
     if item_ids:
-        # Generate per-item forecasts
-        for item_id in item_ids:
-            forecaster = DemandForecaster(place_id, item_id, use_csv=False)
-            train_result = forecaster.train()
-            
+        # Generate per-item forecasts from a single aggregation query
+        training = DemandForecaster.bulk_aggregate(place_id, item_ids)
+        jobs = [(place_id, item_id, days_ahead, training[item_id]) for item_id in item_ids]
+        
+        # Fits are CPU-bound and independent, so spread them over processes;
+        # saving stays in this process. Workers must be forked: they inherit
+        # the configured Django rather than importing this module cold
+        workers = min(workers, len(jobs))
+        if workers > 1 and 'fork' in multiprocessing.get_all_start_methods():
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context('fork')
+            ) as executor:
+                outcomes = list(executor.map(_fit_predict_one, *zip(*jobs)))
+        else:
+            outcomes = [_fit_predict_one(*job) for job in jobs]
+        
+        # Save every successful item together: two INSERTs, one commit
+        counts = iter(save_forecast_batch([
+            (forecaster, predictions)
+            for train_result, forecaster, predictions in outcomes
+            if 'error' not in train_result
+        ]))
+        
+        for item_id, (train_result, forecaster, predictions) in zip(item_ids, outcomes):
             if 'error' not in train_result:
-                predictions = forecaster.predict(days_ahead=days_ahead)
-                count = forecaster.save_forecasts(predictions)
+                count = next(counts)
                 results['forecasts'].append({
                     'item_id': item_id,
                     'count': count,
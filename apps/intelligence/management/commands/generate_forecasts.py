@@ -10,8 +10,11 @@ Usage:
     python manage.py generate_forecasts --place_id=1 --days=7
     python manage.py generate_forecasts --all --days=14
     python manage.py generate_forecasts --place_id=1 --item_ids=101,102
+    python manage.py generate_forecasts --place_id=1 --item_ids=101,102 --workers=4
 """
 
+import os
+
 from django.core.management.base import BaseCommand, CommandError
 from apps.core.models import Place
 from apps.intelligence.forecaster import generate_forecasts_for_place
@@ -42,12 +45,19 @@ class Command(BaseCommand):
             type=str,
             help='Comma-separated list of Item IDs to forecast (e.g. "101,102"). If omitted, forecasts place-level demand.'
         )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=os.cpu_count() or 1,
+            help='Processes to fit item forecasts in (default: CPU count)'
+        )
 
     def handle(self, *args, **options):
         place_id = options.get('place_id')
         generate_all = options.get('all')
         days = options.get('days', 7)
         item_ids_str = options.get('item_ids')
+        workers = max(options.get('workers') or 1, 1)
         
         # Parse item IDs if provided
         item_ids = None
@@ -61,29 +71,35 @@ class Command(BaseCommand):
             raise CommandError("You must specify either --place_id or --all")
         
         if generate_all:
-            places = Place.objects.filter(active=True)
-            self.stdout.write(f"Generating forecasts for {places.count()} places...")
+            # Stream places in chunks rather than counting and caching them all;
+            # each place's frames are released when _generate_for_place returns
+            places = Place.objects.filter(active=True).only('id', 'title').iterator(chunk_size=50)
+            self.stdout.write("Generating forecasts for all active places...")
             
+            processed = 0
             for place in places:
-                self._generate_for_place(place.id, days, item_ids)
+                self._generate_for_place(place, days, item_ids, workers)
+                processed += 1
+            self.stdout.write(f"Processed {processed} places.")
         else:
-            if not Place.objects.filter(pk=place_id).exists():
+            place = Place.objects.filter(pk=place_id).only('id', 'title').first()
+            if place is None:
                 raise CommandError(f"Place with id {place_id} does not exist")
             
-            self._generate_for_place(place_id, days, item_ids)
+            self._generate_for_place(place, days, item_ids, workers)
         
         self.stdout.write(self.style.SUCCESS("Forecast generation complete!"))
 
-    def _generate_for_place(self, place_id, days, item_ids):
+    def _generate_for_place(self, place, days, item_ids, workers=1):
         """Generate forecasts for a single place."""
-        place = Place.objects.get(pk=place_id)
-        self.stdout.write(f"Processing: {place.title} (ID: {place_id})")
+        self.stdout.write(f"Processing: {place.title} (ID: {place.id})")
         
         try:
             result = generate_forecasts_for_place(
-                place_id=place_id,
+                place_id=place.id,
                 days_ahead=days,
-                item_ids=item_ids
+                item_ids=item_ids,
+                workers=workers
             )
             
             if 'error' in result:
@@ -0,0 +1,35 @@
+# Generated by Django 5.2.18 on 2026-10-15 02:01
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0001_initial'),
+        ('intelligence', '0001_initial'),
+        ('inventory', '0002_menuitemaddondefinition_inventoryreport_taxonomyterm'),
+    ]
+
+    operations = [
+        migrations.AlterUniqueTogether(
+            name='demandforecast',
+            unique_together=set(),
+        ),
+        migrations.AddIndex(
+            model_name='demandforecast',
+            index=models.Index(fields=['forecast_model', 'forecast_date'], name='intelligenc_forecas_410141_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='demandforecast',
+            index=models.Index(fields=['place', 'item', 'forecast_date'], name='intelligenc_place_i_548a20_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='forecastmodel',
+            index=models.Index(fields=['place', 'item', 'is_active', '-training_date'], name='intelligenc_place_i_f6061d_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='demandforecast',
+            constraint=models.UniqueConstraint(fields=('forecast_model', 'place', 'item', 'forecast_date'), name='unique_demand_forecast'),
+        ),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 5.2.18 on 2026-10-15 02:03
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0001_initial'),
+        ('intelligence', '0002_forecast_indexes'),
+        ('inventory', '0002_menuitemaddondefinition_inventoryreport_taxonomyterm'),
+    ]
+
+    operations = [
+        migrations.RemoveConstraint(
+            model_name='demandforecast',
+            name='unique_demand_forecast',
+        ),
+        migrations.AddConstraint(
+            model_name='demandforecast',
+            constraint=models.UniqueConstraint(condition=models.Q(('item__isnull', False)), fields=('forecast_model', 'place', 'item', 'forecast_date'), name='unique_item_demand_forecast'),
+        ),
+        migrations.AddConstraint(
+            model_name='demandforecast',
+            constraint=models.UniqueConstraint(condition=models.Q(('item__isnull', True)), fields=('forecast_model', 'place', 'forecast_date'), name='unique_place_demand_forecast'),
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 5.2.18 on 2026-10-15 02:08
+
+import django.db.models.functions.datetime
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('intelligence', '0003_partial_forecast_constraints'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='demandforecast',
+            name='created_at',
+            field=models.DateTimeField(db_default=django.db.models.functions.datetime.Now(), editable=False),
+        ),
+        migrations.AlterField(
+            model_name='forecastmodel',
+            name='training_date',
+            field=models.DateTimeField(db_default=django.db.models.functions.datetime.Now(), editable=False),
+        ),
+    ]
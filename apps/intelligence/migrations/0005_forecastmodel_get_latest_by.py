@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-15 02:10
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('intelligence', '0004_db_default_timestamps'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='forecastmodel',
+            options={'get_latest_by': 'training_date', 'ordering': ['-training_date'], 'verbose_name': 'Forecast Model', 'verbose_name_plural': 'Forecast Models'},
+        ),
+    ]
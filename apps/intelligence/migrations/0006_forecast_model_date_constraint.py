@@ -0,0 +1,31 @@
+# Generated by Django 5.2.18 on 2026-10-15 02:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0001_initial'),
+        ('intelligence', '0005_forecastmodel_get_latest_by'),
+        ('inventory', '0002_menuitemaddondefinition_inventoryreport_taxonomyterm'),
+    ]
+
+    operations = [
+        migrations.RemoveConstraint(
+            model_name='demandforecast',
+            name='unique_item_demand_forecast',
+        ),
+        migrations.RemoveConstraint(
+            model_name='demandforecast',
+            name='unique_place_demand_forecast',
+        ),
+        migrations.RemoveIndex(
+            model_name='demandforecast',
+            name='intelligenc_forecas_410141_idx',
+        ),
+        migrations.AddConstraint(
+            model_name='demandforecast',
+            constraint=models.UniqueConstraint(fields=('forecast_model', 'forecast_date'), name='unique_model_forecast_date'),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-15 02:14
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0001_initial'),
+        ('intelligence', '0006_forecast_model_date_constraint'),
+        ('inventory', '0002_menuitemaddondefinition_inventoryreport_taxonomyterm'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='forecastmodel',
+            name='intelligenc_place_i_f6061d_idx',
+        ),
+        migrations.AddIndex(
+            model_name='forecastmodel',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['place', 'item', '-training_date'], name='active_forecast_model_idx'),
+        ),
+    ]
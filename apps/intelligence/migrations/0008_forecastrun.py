@@ -0,0 +1,28 @@
+# Generated by Django 5.2.18 on 2026-10-15 02:35
+
+import django.db.models.deletion
+import django.db.models.functions.datetime
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0001_initial'),
+        ('intelligence', '0007_active_forecast_model_partial_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ForecastRun',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('started_at', models.DateTimeField(db_default=django.db.models.functions.datetime.Now(), editable=False)),
+                ('place', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='forecast_run', to='core.place')),
+            ],
+            options={
+                'verbose_name': 'Forecast Run',
+                'verbose_name_plural': 'Forecast Runs',
+            },
+        ),
+    ]
@@ -5,6 +5,7 @@ This module defines models for storing demand forecasts and model metadata.
 """
 
 from django.db import models
+from django.db.models.functions import Now
 from apps.core.models import Place
 from apps.inventory.models import Item
 
@@ -49,7 +50,8 @@ class ForecastModel(models.Model):
     )
     
     # Training metadata
-    training_date = models.DateTimeField(auto_now_add=True)
+    # Filled in by the database, so bulk inserts don't send it per row
+    training_date = models.DateTimeField(db_default=Now(), editable=False)
     training_start_date = models.DateField(
         help_text="Start of training data range"
     )
@@ -76,6 +78,16 @@ class ForecastModel(models.Model):
     
     class Meta:
         ordering = ['-training_date']
+        get_latest_by = 'training_date'
+        indexes = [
+            # Latest active model for a place/item; every read filters on
+            # is_active, so superseded models stay out of the index
+            models.Index(
+                fields=['place', 'item', '-training_date'],
+                condition=models.Q(is_active=True),
+                name='active_forecast_model_idx',
+            ),
+        ]
         verbose_name = "Forecast Model"
         verbose_name_plural = "Forecast Models"
     
@@ -159,11 +171,21 @@ class DemandForecast(models.Model):
     )
     
     # Metadata
-    created_at = models.DateTimeField(auto_now_add=True)
+    created_at = models.DateTimeField(db_default=Now(), editable=False)
     
     class Meta:
         ordering = ['forecast_date']
-        unique_together = ['forecast_model', 'place', 'item', 'forecast_date']
+        constraints = [
+            # A model belongs to one place/item, so this is one forecast per
+            # place/item/date per model; its index also serves date-range reads
+            models.UniqueConstraint(
+                fields=['forecast_model', 'forecast_date'],
+                name='unique_model_forecast_date',
+            ),
+        ]
+        indexes = [
+            models.Index(fields=['place', 'item', 'forecast_date']),
+        ]
         verbose_name = "Demand Forecast"
         verbose_name_plural = "Demand Forecasts"
     
@@ -180,3 +202,26 @@ class DemandForecast(models.Model):
     def confidence_interval_95(self):
         """Returns the 95% confidence interval as a tuple."""
         return (self.lower_bound_95, self.upper_bound_95)
+
+
+class ForecastRun(models.Model):
+    """
+    Claim on a place while its forecasts are being generated.
+    
+    The place is unique, so a second concurrent run fails to insert its
+    claim and backs off. Claims are deleted when the run ends; one left
+    by a crashed run expires after tasks.FORECAST_RUN_TIMEOUT.
+    """
+    place = models.OneToOneField(
+        Place,
+        on_delete=models.CASCADE,
+        related_name='forecast_run'
+    )
+    started_at = models.DateTimeField(db_default=Now(), editable=False)
+    
+    class Meta:
+        verbose_name = "Forecast Run"
+        verbose_name_plural = "Forecast Runs"
+    
+    def __str__(self):
+        return f"Forecast run for place {self.place_id} since {self.started_at}"
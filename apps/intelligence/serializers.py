@@ -2,11 +2,33 @@
 Django REST Framework serializers for the intelligence app.
 """
 
+import copy
+
 from rest_framework import serializers
 from apps.intelligence.models import DemandForecast, ForecastModel
 
 
-class ForecastModelSerializer(serializers.ModelSerializer):
+class CachedFieldsMixin:
+    """
+    Build a ModelSerializer's fields once per class.
+    
+    ModelSerializer.get_fields() deep-copies the declared fields and
+    introspects the model on every instantiation. The result only depends
+    on the class, so keep it and hand each instance shallow copies, which
+    DRF then binds to the new parent as usual.
+    """
+    
+    def get_fields(self):
+        cls = type(self)
+        # Look in the class's own __dict__ so subclasses build their own
+        cached = cls.__dict__.get('_cached_fields')
+        if cached is None:
+            cached = super().get_fields()
+            cls._cached_fields = cached
+        return {name: copy.copy(field) for name, field in cached.items()}
+
+
+class ForecastModelSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """Serializer for ForecastModel metadata."""
     
     place_name = serializers.CharField(source='place.title', read_only=True)
@@ -38,7 +60,7 @@ class DateRangeSerializer(serializers.Serializer):
     end = serializers.DateField()
 
 
-class DemandForecastSerializer(serializers.ModelSerializer):
+class DemandForecastSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """Serializer for individual demand forecasts."""
     
     item_name = serializers.CharField(source='item.title', read_only=True, allow_null=True)
@@ -55,8 +77,90 @@ class DemandForecastSerializer(serializers.ModelSerializer):
         ]
 
 
+def serialize_forecasts_fast(queryset) -> list:
+    """
+    DemandForecastSerializer(queryset, many=True).data for read-only lists.
+    
+    Reads the rows with one values_list() query (item title joined in)
+    instead of running the ModelSerializer field pipeline per row.
+    """
+    fields = DemandForecastSerializer().fields
+    forecast_date = fields['forecast_date'].to_representation
+    created_at = fields['created_at'].to_representation
+    
+    rows = queryset.values_list(
+        'id', 'forecast_date', 'item_id', 'item__title',
+        'predicted_quantity',
+        'lower_bound_80', 'upper_bound_80',
+        'lower_bound_95', 'upper_bound_95',
+        'trend', 'weekly_seasonality',
+        'created_at'
+    )
+    return [
+        {
+            'id': pk,
+            'forecast_date': forecast_date(date),
+            'item': item_id,
+            'item_name': item_name,
+            'predicted_quantity': predicted,
+            'lower_bound_80': lower_80,
+            'upper_bound_80': upper_80,
+            'lower_bound_95': lower_95,
+            'upper_bound_95': upper_95,
+            'trend': trend,
+            'weekly_seasonality': weekly,
+            'created_at': created_at(created),
+        }
+        for (pk, date, item_id, item_name, predicted, lower_80, upper_80,
+             lower_95, upper_95, trend, weekly, created) in rows
+    ]
+
+
+def serialize_forecast_models_fast(queryset) -> list:
+    """
+    ForecastModelSerializer(queryset, many=True).data for read-only lists.
+    
+    Same approach as serialize_forecasts_fast(): one values_list() query
+    with the place and item titles joined in.
+    """
+    fields = ForecastModelSerializer().fields
+    training_date = fields['training_date'].to_representation
+    start_date = fields['training_start_date'].to_representation
+    end_date = fields['training_end_date'].to_representation
+    
+    rows = queryset.values_list(
+        'id', 'place_id', 'place__title', 'item_id', 'item__title',
+        'mape', 'rmse', 'mae',
+        'training_date', 'training_start_date', 'training_end_date',
+        'data_points_used', 'is_active'
+    )
+    return [
+        {
+            'id': pk,
+            'place': place_id,
+            'place_name': place_name,
+            'item': item_id,
+            'item_name': item_name,
+            'mape': mape,
+            'rmse': rmse,
+            'mae': mae,
+            'training_date': training_date(trained),
+            'training_start_date': start_date(start),
+            'training_end_date': end_date(end),
+            'data_points_used': data_points,
+            'is_active': is_active,
+        }
+        for (pk, place_id, place_name, item_id, item_name, mape, rmse, mae,
+             trained, start, end, data_points, is_active) in rows
+    ]
+
+
 class ForecastSummarySerializer(serializers.Serializer):
-    """Serializer for forecast summary responses."""
+    """
+    Serializer for forecast summary responses.
+    
+    Describes the response shape; the forecast views build it directly.
+    """
     
     place_id = serializers.IntegerField()
     place_name = serializers.CharField()
@@ -65,7 +169,8 @@ class ForecastSummarySerializer(serializers.Serializer):
     forecast_count = serializers.IntegerField()
     date_range = DateRangeSerializer()
     metrics = ForecastMetricsSerializer()
-    forecasts = DemandForecastSerializer(many=True)
+    # Already serialized by serialize_forecasts_fast()
+    forecasts = serializers.ListField(child=serializers.DictField())
 
 
 class ForecastNotFoundSerializer(serializers.Serializer):
@@ -78,6 +183,21 @@ class ForecastNotFoundSerializer(serializers.Serializer):
     item_id = serializers.IntegerField(required=False, allow_null=True)
 
 
+class ForecastQuerySerializer(serializers.Serializer):
+    """Serializer for forecast list/item query parameters."""
+    
+    days = serializers.IntegerField(
+        default=7,
+        min_value=1,
+        max_value=365,
+        help_text="Number of days to return from the model's anchor date"
+    )
+    include_history = serializers.BooleanField(
+        default=False,
+        help_text="Also return the 7 days before the anchor date"
+    )
+
+
 class GenerateForecastRequestSerializer(serializers.Serializer):
     """Serializer for forecast generation request."""
     
@@ -104,6 +224,8 @@ class GenerateForecastRequestSerializer(serializers.Serializer):
     def validate_item_ids(self, value):
         if value:
             from apps.inventory.models import Item
+            # A repeated id would train and save the same item twice
+            value = list(dict.fromkeys(value))
             existing_ids = set(Item.objects.filter(pk__in=value).values_list('pk', flat=True))
             missing = set(value) - existing_ids
             if missing:
@@ -130,7 +252,12 @@ class GenerateForecastErrorSerializer(serializers.Serializer):
 
 
 class ForecastModelsListSerializer(serializers.Serializer):
-    """Serializer for forecast models list response."""
+    """
+    Serializer for forecast models list response.
+    
+    Describes the response shape; ForecastModelsListView builds it directly.
+    """
     
     count = serializers.IntegerField()
-    models = ForecastModelSerializer(many=True)
+    # Already serialized by serialize_forecast_models_fast()
+    models = serializers.ListField(child=serializers.DictField())
@@ -0,0 +1,57 @@
+"""
+Cache invalidation for the intelligence app.
+
+AvailablePlacesView and PlaceItemsView cache their response data, and the
+dashboard caches its place selector. Saving or deleting a Place or Item
+drops the affected entries; changes that bypass signals (bulk loads, new
+orders) are covered by the timeouts.
+
+The forecast views cache the active ForecastModel per place/item.
+save_forecast_batch() drops those entries itself, as bulk_create() and
+update() send no signals; the receivers below cover other saves.
+"""
+
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from apps.core.models import Place
+from apps.intelligence.models import ForecastModel
+from apps.inventory.models import Item
+
+LIST_CACHE_TIMEOUT = 300
+AVAILABLE_PLACES_CACHE_KEY = 'intelligence:available_places'
+PLACE_ITEMS_VERSION_KEY = 'intelligence:place_items_version'
+DASHBOARD_CACHE_TIMEOUT = 60
+DASHBOARD_PLACES_CACHE_KEY = 'intelligence:dashboard_places'
+
+
+def place_items_cache_key(place_id: int) -> str:
+    """Cache key for a place's items, scoped to the current item version."""
+    version = cache.get(PLACE_ITEMS_VERSION_KEY, 0)
+    return f'intelligence:place_items:{version}:{place_id}'
+
+
+def active_model_cache_key(place_id: int, item_id=None) -> str:
+    """Cache key for the active model of a place (item_id=None) or item."""
+    return f'intelligence:active_model:{place_id}:{item_id or 0}'
+
+
+@receiver([post_save, post_delete], sender=Place)
+def invalidate_available_places(sender, **kwargs):
+    cache.delete_many([AVAILABLE_PLACES_CACHE_KEY, DASHBOARD_PLACES_CACHE_KEY])
+
+
+@receiver([post_save, post_delete], sender=Item)
+def invalidate_place_items(sender, **kwargs):
+    # Item titles appear in every place's list; bump the version rather
+    # than tracking which places' keys exist
+    try:
+        cache.incr(PLACE_ITEMS_VERSION_KEY)
+    except ValueError:
+        cache.set(PLACE_ITEMS_VERSION_KEY, 1, None)
+
+
+@receiver([post_save, post_delete], sender=ForecastModel)
+def invalidate_active_model(sender, instance, **kwargs):
+    cache.delete(active_model_cache_key(instance.place_id, instance.item_id))
@@ -0,0 +1,90 @@
+"""
+Background forecast generation.
+
+Celery is optional: when it is installed and CELERY_BROKER_URL is set,
+GenerateForecastView queues generate_forecasts_task; otherwise forecasts
+are generated in the request with run_forecast_generation().
+"""
+
+from datetime import timedelta
+from typing import Any, Dict, List, Optional
+
+from django.conf import settings
+from django.db import IntegrityError, OperationalError, transaction
+from django.utils import timezone
+
+from apps.intelligence.forecaster import generate_forecasts_for_place
+from apps.intelligence.models import ForecastRun
+
+try:
+    from celery import shared_task
+except ImportError:
+    shared_task = None
+
+# A claim older than this is taken to be left by a crashed run
+FORECAST_RUN_TIMEOUT = timedelta(hours=1)
+
+
+def claim_place(place_id: int) -> Optional[ForecastRun]:
+    """
+    Mark a place as being forecast, or return None if a run already is.
+    
+    Inserting the claim is the lock: ForecastRun.place is unique, so this
+    works the same on every backend and holds no transaction open.
+    """
+    with transaction.atomic():
+        ForecastRun.objects.filter(
+            place_id=place_id,
+            started_at__lt=timezone.now() - FORECAST_RUN_TIMEOUT
+        ).delete()
+        try:
+            with transaction.atomic():
+                return ForecastRun.objects.create(place_id=place_id)
+        except IntegrityError:
+            return None
+
+
+def run_forecast_generation(
+    place_id: int,
+    days_ahead: int = 7,
+    item_ids: Optional[List[int]] = None
+) -> Optional[Dict[str, Any]]:
+    """
+    Generate forecasts for a place, one run per place at a time.
+    
+    Training runs outside any transaction; save_forecast_batch() writes
+    the results in its own short one.
+    
+    Returns:
+        generate_forecasts_for_place()'s summary, or None if another run
+        already holds the place
+    """
+    claim = claim_place(place_id)
+    if claim is None:
+        return None
+    
+    try:
+        return generate_forecasts_for_place(
+            place_id=place_id,
+            days_ahead=days_ahead,
+            item_ids=item_ids
+        )
+    finally:
+        # By pk: if this claim expired, a newer run's claim stays
+        ForecastRun.objects.filter(pk=claim.pk).delete()
+
+
+if shared_task is not None:
+    # Retry only on database hiccups; bad input would fail again
+    generate_forecasts_task = shared_task(
+        acks_late=True,
+        autoretry_for=(OperationalError,),
+        retry_backoff=True
+    )(run_forecast_generation)
+else:
+    generate_forecasts_task = None
+
+
+def tasks_enabled() -> bool:
+    """Whether forecast generation should be queued to Celery."""
+    return generate_forecasts_task is not None and bool(getattr(settings, 'CELERY_BROKER_URL', None))
@@ -53,7 +53,12 @@ class DemandForecasterTestCase(TestCase):
     def _create_test_orders(cls, place, item, days=30):
         """Create test order data."""
         base_date = timezone.now() - timedelta(days=days)
+        total_amount = Decimal("10.00")
+        # Quantities run from 1 to 4; build each Decimal once
+        quantity_values = [Decimal(n) for n in range(5)]
         
+        orders = []
+        quantities = []
         for i in range(days):
             order_date = base_date + timedelta(days=i)
             
@@ -61,21 +66,27 @@ class DemandForecasterTestCase(TestCase):
             num_orders = 2 + (i % 4)
             
             for j in range(num_orders):
-                order = Order.objects.create(
+                orders.append(Order(
                     place=place,
                     status='Complete',
-                    total_amount=Decimal("10.00"),
+                    total_amount=total_amount,
                     created_at=order_date + timedelta(hours=10 + j)
-                )
+                ))
                 
                 # Add order items with varying quantities
-                quantity = Decimal(str(1 + (i % 3) + (j % 2)))
-                OrderItem.objects.create(
-                    order=order,
-                    item=item,
-                    quantity=quantity,
-                    price=item.price
-                )
+                quantities.append(quantity_values[1 + (i % 3) + (j % 2)])
+        
+        # Two bulk INSERTs instead of one per order and order item
+        Order.objects.bulk_create(orders)
+        OrderItem.objects.bulk_create([
+            OrderItem(
+                order=order,
+                item=item,
+                quantity=quantity,
+                price=item.price
+            )
+            for order, quantity in zip(orders, quantities)
+        ])
     
     def test_forecaster_initialization(self):
         """Test forecaster initializes correctly."""
@@ -136,6 +147,34 @@ class DemandForecasterTestCase(TestCase):
         self.assertIn('ds', df.columns)
         self.assertIn('y', df.columns)
     
+    def test_bulk_aggregate_matches_per_item(self):
+        """Test one bulk query gives the same series as per-item aggregation."""
+        other = Item.objects.create(
+            place=self.place,
+            title="Test Fries",
+            price=Decimal("3.50"),
+            category=self.category
+        )
+        base_date = timezone.now() - timedelta(days=20)
+        for i in range(20):
+            order = Order.objects.create(
+                place=self.place,
+                status='Closed',
+                total_amount=Decimal("10.00"),
+                created_at=base_date + timedelta(days=i)
+            )
+            OrderItem.objects.create(order=order, item=self.item, quantity=1 + i % 3, price=self.item.price)
+            if i % 2:
+                OrderItem.objects.create(order=order, item=other, quantity=2, price=other.price)
+
+        bulk = DemandForecaster.bulk_aggregate(self.place.id, [self.item.id, other.id])
+
+        for item_id in (self.item.id, other.id):
+            expected = DemandForecaster(self.place.id, item_id).aggregate_sales_data()
+            self.assertGreater(len(bulk[item_id]), 0)
+            self.assertEqual(list(bulk[item_id]['ds']), list(expected['ds']))
+            self.assertEqual(list(bulk[item_id]['y']), list(expected['y']))
+
     def test_add_features(self):
         """Test feature engineering."""
         forecaster = DemandForecaster(place_id=self.place.id)
@@ -0,0 +1,261 @@
+"""
+API tests for the intelligence app's views.
+
+Tests forecast generation and the forecast read endpoints.
+"""
+
+from datetime import timedelta
+from decimal import Decimal
+from unittest.mock import patch
+
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import serializers, status
+from rest_framework.test import APITestCase
+
+from apps.core.models import Place
+from apps.inventory.models import Item, StockCategory
+from apps.intelligence.models import DemandForecast, ForecastModel, ForecastRun
+from apps.sales.models import Order, OrderItem
+from apps.intelligence.tasks import FORECAST_RUN_TIMEOUT
+
+
+def fake_summary(place_id, days_ahead=7, item_ids=None):
+    """A generate_forecasts_for_place() result without training anything."""
+    return {
+        'place_id': place_id,
+        'forecasts': [{
+            'item_id': None,
+            'count': days_ahead,
+            'metrics': {'mape': 10.0, 'rmse': 2.0, 'mae': 1.5}
+        }]
+    }
+
+
+class GenerateForecastViewTestCase(APITestCase):
+    """Tests for POST /api/forecast/generate/."""
+    
+    @classmethod
+    def setUpTestData(cls):
+        cls.place = Place.objects.create(title="Test Restaurant", active=True)
+        cls.url = reverse('intelligence:generate-forecast')
+    
+    @patch('apps.intelligence.tasks.generate_forecasts_for_place', side_effect=fake_summary)
+    def test_generate_releases_claim(self, generate):
+        """Test a run succeeds and leaves the place free for the next one."""
+        response = self.client.post(self.url, {'place_id': self.place.id}, format='json')
+        
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data['forecasts_generated'], 7)
+        self.assertFalse(ForecastRun.objects.exists())
+    
+    def test_concurrent_run_is_already_running(self):
+        """Test a second run for a place that is being forecast returns 202."""
+        nested = []
+        
+        def generate(place_id, days_ahead=7, item_ids=None):
+            # A second request arrives while the first is still training
+            nested.append(self.client.post(self.url, {'place_id': place_id}, format='json'))
+            return fake_summary(place_id, days_ahead, item_ids)
+        
+        with patch('apps.intelligence.tasks.generate_forecasts_for_place', side_effect=generate) as mocked:
+            response = self.client.post(self.url, {'place_id': self.place.id}, format='json')
+        
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(nested[0].status_code, status.HTTP_202_ACCEPTED)
+        self.assertEqual(nested[0].data['status'], 'already_running')
+        self.assertEqual(mocked.call_count, 1)
+        self.assertFalse(ForecastRun.objects.exists())
+    
+    @patch('apps.intelligence.tasks.generate_forecasts_for_place', side_effect=fake_summary)
+    def test_stale_claim_is_taken_over(self, generate):
+        """Test a claim left by a crashed run expires."""
+        claim = ForecastRun.objects.create(place=self.place)
+        ForecastRun.objects.filter(pk=claim.pk).update(
+            started_at=claim.started_at - FORECAST_RUN_TIMEOUT - timedelta(minutes=1)
+        )
+        
+        response = self.client.post(self.url, {'place_id': self.place.id}, format='json')
+        
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertFalse(ForecastRun.objects.exists())
+
+
+class ForecastListViewTestCase(APITestCase):
+    """Tests for GET /api/forecast/{place_id}/."""
+    
+    @classmethod
+    def setUpTestData(cls):
+        cls.place = Place.objects.create(title="Test Restaurant", active=True)
+        cls.end_date = timezone.now().date()
+        cls.forecast_model = ForecastModel.objects.create(
+            place=cls.place,
+            mape=12.5,
+            rmse=3.25,
+            mae=2.0,
+            training_start_date=cls.end_date - timedelta(days=90),
+            training_end_date=cls.end_date
+        )
+        DemandForecast.objects.bulk_create([
+            DemandForecast(
+                forecast_model=cls.forecast_model,
+                place=cls.place,
+                forecast_date=cls.end_date + timedelta(days=day),
+                predicted_quantity=10.0 + day,
+                lower_bound_80=8.0,
+                upper_bound_80=12.0
+            )
+            for day in range(1, 8)
+        ])
+        cls.url = reverse('intelligence:forecast-list', args=[cls.place.id])
+    
+    def test_response_shape(self):
+        """Test the response keeps the ForecastSummarySerializer shape and formats."""
+        # Twice: the second response is served from the cache
+        for _ in range(2):
+            response = self.client.get(self.url)
+            
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            data = response.json()
+            self.assertEqual(list(data), [
+                'place_id', 'place_name', 'item_id', 'item_name',
+                'forecast_count', 'date_range', 'metrics', 'forecasts'
+            ])
+            self.assertEqual(data['place_name'], "Test Restaurant")
+            self.assertEqual(data['forecast_count'], 7)
+            self.assertEqual(data['date_range'], {
+                'start': (self.end_date + timedelta(days=1)).isoformat(),
+                'end': (self.end_date + timedelta(days=8)).isoformat()
+            })
+            self.assertEqual(data['metrics'], {
+                'mape': 12.5,
+                'rmse': 3.25,
+                'mae': 2.0,
+                'training_date': serializers.DateTimeField().to_representation(
+                    self.forecast_model.training_date
+                )
+            })
+            self.assertEqual(
+                [row['predicted_quantity'] for row in data['forecasts']],
+                [11.0, 12.0, 13.0, 14.0, 15.0, 16.0, 17.0]
+            )
+    
+    def test_browsable_api(self):
+        """Test content negotiation still serves the browsable API."""
+        response = self.client.get(self.url, HTTP_ACCEPT='text/html')
+        
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response['Content-Type'].startswith('text/html'))
+        self.assertIn('Accept', response['Vary'])
+    
+    def test_invalid_query_params(self):
+        """Test bad days or include_history values return 400 with field errors."""
+        for params, field in [
+            ({'days': 'abc'}, 'days'),
+            ({'days': 0}, 'days'),
+            ({'days': 366}, 'days'),
+            ({'include_history': 'maybe'}, 'include_history'),
+        ]:
+            response = self.client.get(self.url, params)
+            
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST, params)
+            self.assertIn(field, response.data)
+    
+    def test_etag_not_modified(self):
+        """Test a matching If-None-Match gets 304 with the caching headers."""
+        response = self.client.get(self.url)
+        etag = response['ETag']
+        self.assertIn('max-age=300', response['Cache-Control'])
+        
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response['ETag'], etag)
+        self.assertIn('max-age=300', response['Cache-Control'])
+        
+        # Other query parameters are a different response
+        response = self.client.get(self.url, {'days': 3}, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+
+class ForecastItemViewTestCase(APITestCase):
+    """Tests for GET /api/forecast/{place_id}/item/{item_id}/."""
+    
+    @classmethod
+    def setUpTestData(cls):
+        cls.place = Place.objects.create(title="Test Restaurant", active=True)
+        cls.category = StockCategory.objects.create(place=cls.place, title="Food")
+        cls.item = Item.objects.create(
+            place=cls.place,
+            title="Test Burger",
+            price=Decimal("9.99"),
+            category=cls.category
+        )
+        cls.url = reverse('intelligence:forecast-item', args=[cls.place.id, cls.item.id])
+    
+    def test_invalid_days(self):
+        """Test a non-numeric days returns 400 instead of failing."""
+        response = self.client.get(self.url, {'days': 'x'})
+        
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('days', response.data)
+
+
+class ForecastCacheInvalidationTestCase(APITestCase):
+    """Tests that cached forecasts are replaced once new ones are generated."""
+    
+    @classmethod
+    def setUpTestData(cls):
+        cls.place = Place.objects.create(title="Test Restaurant", active=True)
+        cls.category = StockCategory.objects.create(place=cls.place, title="Food")
+        cls.item = Item.objects.create(
+            place=cls.place,
+            title="Test Burger",
+            price=Decimal("9.99"),
+            category=cls.category
+        )
+        
+        # 30 days of closed orders, enough to train the fallback model
+        base_date = timezone.now() - timedelta(days=30)
+        orders = Order.objects.bulk_create([
+            Order(
+                place=cls.place,
+                status='Closed',
+                total_amount=Decimal("10.00"),
+                created_at=base_date + timedelta(days=day, hours=12)
+            )
+            for day in range(30)
+        ])
+        OrderItem.objects.bulk_create([
+            OrderItem(order=order, item=cls.item, quantity=1 + day % 3, price=cls.item.price)
+            for day, order in enumerate(orders)
+        ])
+        cls.list_url = reverse('intelligence:forecast-list', args=[cls.place.id])
+        cls.generate_url = reverse('intelligence:generate-forecast')
+    
+    def generate(self):
+        # The cache is cleared on commit; run those hooks inside the test transaction
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(self.generate_url, {'place_id': self.place.id}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        return ForecastModel.objects.get(place=self.place, item=None, is_active=True)
+    
+    def test_generation_replaces_cached_forecast(self):
+        """Test the list serves the new model, not the cached one, after generation."""
+        first_model = self.generate()
+        response = self.client.get(self.list_url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        first_etag = response['ETag']
+        self.assertIn(f'fc-{first_model.pk}-', first_etag)
+        
+        second_model = self.generate()
+        self.assertNotEqual(first_model.pk, second_model.pk)
+        
+        # The old ETag no longer matches, and the body comes from the new model
+        response = self.client.get(self.list_url, HTTP_IF_NONE_MATCH=first_etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn(f'fc-{second_model.pk}-', response['ETag'])
+        self.assertEqual(
+            response.json()['metrics']['training_date'],
+            serializers.DateTimeField().to_representation(second_model.training_date)
+        )
@@ -16,15 +16,16 @@ from apps.intelligence.views import (
 app_name = 'intelligence'
 
 urlpatterns = [
-    # Dashboard
-    path('', ForecastDashboardView.as_view(), name='dashboard'),
-    
-    # API endpoints
-    path('api/forecast/generate/', GenerateForecastView.as_view(), name='generate-forecast'),
-    path('api/forecast/models/', ForecastModelsListView.as_view(), name='forecast-models'),
-    path('api/forecast/places/', AvailablePlacesView.as_view(), name='available-places'),
-    path('api/forecast/places/<int:place_id>/items/', PlaceItemsView.as_view(), name='place-items'),
+    # API endpoints, most requested first. The <int:...> converters can't
+    # match the literal segments below, so the order doesn't change routing
     path('api/forecast/<int:place_id>/', ForecastListView.as_view(), name='forecast-list'),
     path('api/forecast/<int:place_id>/item/<int:item_id>/', ForecastItemView.as_view(), name='forecast-item'),
+    path('api/forecast/places/', AvailablePlacesView.as_view(), name='available-places'),
+    path('api/forecast/places/<int:place_id>/items/', PlaceItemsView.as_view(), name='place-items'),
+    path('api/forecast/generate/', GenerateForecastView.as_view(), name='generate-forecast'),
+    path('api/forecast/models/', ForecastModelsListView.as_view(), name='forecast-models'),
+    
+    # Dashboard
+    path('', ForecastDashboardView.as_view(), name='dashboard'),
 ]
 
@@ -7,9 +7,14 @@ Provides REST endpoints for demand forecasting:
 - POST /api/forecast/generate/ - Trigger forecast generation
 """
 
+import hashlib
 from datetime import timedelta
-from django.utils import timezone
+from django.core.cache import cache
 from django.shortcuts import get_object_or_404
+from django.utils.decorators import method_decorator
+from django.views.decorators.cache import cache_control
+from django.views.decorators.http import etag
+from django.views.decorators.vary import vary_on_headers
 from django.views.generic import TemplateView
 from rest_framework import status
 from rest_framework.views import APIView
@@ -19,18 +24,87 @@ from apps.core.models import Place
 from apps.inventory.models import Item
 from apps.intelligence.models import DemandForecast, ForecastModel
 from apps.intelligence.serializers import (
-    DemandForecastSerializer,
-    ForecastModelSerializer,
-    ForecastSummarySerializer,
     ForecastNotFoundSerializer,
+    ForecastQuerySerializer,
     ForecastMetricsSerializer,
     DateRangeSerializer,
-    ForecastModelsListSerializer,
     GenerateForecastRequestSerializer,
     GenerateForecastResponseSerializer,
     GenerateForecastErrorSerializer,
+    serialize_forecast_models_fast,
+    serialize_forecasts_fast,
 )
-from apps.intelligence.forecaster import DemandForecaster, generate_forecasts_for_place
+from apps.intelligence.tasks import generate_forecasts_task, run_forecast_generation, tasks_enabled
+from apps.intelligence.signals import (
+    AVAILABLE_PLACES_CACHE_KEY,
+    DASHBOARD_CACHE_TIMEOUT,
+    DASHBOARD_PLACES_CACHE_KEY,
+    LIST_CACHE_TIMEOUT,
+    active_model_cache_key,
+    place_items_cache_key,
+)
+
+
+def cached_response(key, build):
+    """
+    Serve response data from the cache, calling build() on a miss.
+    
+    build() must return serialized data (strings, numbers, lists, dicts),
+    so hits skip the queries and field formatting; rendering still goes
+    through DRF content negotiation.
+    """
+    data = cache.get(key)
+    if data is None:
+        data = build()
+        cache.set(key, data, LIST_CACHE_TIMEOUT)
+    return Response(data)
+
+
+def active_forecast_models(place_id, item_id=None):
+    """Active models for a place (item_id=None: place-level); latest() is the current one."""
+    return ForecastModel.objects.filter(
+        place_id=place_id,
+        item_id=item_id,
+        is_active=True
+    )
+
+
+def active_forecast_model(place_id, item_id=None):
+    """
+    The active model for a place (item_id=None: place-level), or None.
+    
+    Cached until a new model is saved for the same place/item, so the
+    ETag check and the view share one lookup across requests.
+    """
+    key = active_model_cache_key(place_id, item_id)
+    forecast_model = cache.get(key)
+    if forecast_model is None:
+        try:
+            forecast_model = active_forecast_models(place_id, item_id).defer('model_params').latest()
+        except ForecastModel.DoesNotExist:
+            return None
+        cache.set(key, forecast_model, LIST_CACHE_TIMEOUT)
+    return forecast_model
+
+
+def forecast_etag(request, place_id, item_id=None):
+    """
+    ETag for a forecast response.
+    
+    Forecasts never change once saved, so the response is fixed by the
+    model it is read from, the query parameters, and the Accept header
+    (JSON or the browsable API).
+    """
+    forecast_model = active_forecast_model(place_id, item_id)
+    if forecast_model is None:
+        return None
+    accept = hashlib.md5(request.META.get('HTTP_ACCEPT', '').encode()).hexdigest()[:8]
+    return f'fc-{forecast_model.pk}-{accept}-{request.GET.urlencode()}'
+
+
+def forecast_cache_key(forecast_model, days, include_history=False):
+    """Cache key for a forecast response; a new model gets new keys."""
+    return f'intelligence:forecast:{forecast_model.pk}:{days}:{int(include_history)}'
 
 
 class ForecastListView(APIView):
@@ -44,21 +118,22 @@ class ForecastListView(APIView):
         include_history (bool): Whether to include past predictions (default: false)
     """
     
+    @method_decorator(cache_control(max_age=300, private=True))
+    @method_decorator(vary_on_headers('Accept'))
+    @method_decorator(etag(forecast_etag))
     def get(self, request, place_id):
-        place = get_object_or_404(Place, pk=place_id)
-        
         # Parse query parameters
-        days = int(request.query_params.get('days', 7))
-        include_history = request.query_params.get('include_history', 'false').lower() == 'true'
+        query_serializer = ForecastQuerySerializer(data=request.query_params)
+        if not query_serializer.is_valid():
+            return Response(query_serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+        days = query_serializer.validated_data['days']
+        include_history = query_serializer.validated_data['include_history']
         
-        # Get active forecast model for this place (no specific item)
-        forecast_model = ForecastModel.objects.filter(
-            place=place,
-            item__isnull=True,
-            is_active=True
-        ).order_by('-training_date').first()
+        place = get_object_or_404(Place, pk=place_id)
         
-        if not forecast_model:
+        # Get active forecast model for this place (no specific item)
+        forecast_model = active_forecast_model(place.pk)
+        if forecast_model is None:
             error_data = {
                 'status': 'no_forecast',
                 'message': f'No forecast available for place {place.title}. Please generate forecasts first.',
@@ -75,34 +150,31 @@ class ForecastListView(APIView):
         start_date = anchor_date - timedelta(days=7) if include_history else anchor_date
         end_date = anchor_date + timedelta(days=days)
         
-        forecasts = DemandForecast.objects.filter(
-            forecast_model=forecast_model,
-            forecast_date__gte=start_date,
-            forecast_date__lte=end_date
-        ).order_by('forecast_date')
-        
-        # Build response using serializers
-        response_data = {
-            'place_id': place_id,
-            'place_name': place.title,
-            'item_id': None,
-            'item_name': None,
-            'forecast_count': forecasts.count(),
-            'date_range': {
-                'start': start_date,
-                'end': end_date
-            },
-            'metrics': {
-                'mape': forecast_model.mape,
-                'rmse': forecast_model.rmse,
-                'mae': forecast_model.mae,
-                'training_date': forecast_model.training_date
-            },
-            'forecasts': forecasts
-        }
+        def build():
+            forecasts = DemandForecast.objects.filter(
+                forecast_model=forecast_model,
+                forecast_date__gte=start_date,
+                forecast_date__lte=end_date
+            ).order_by('forecast_date')
+            forecast_rows = serialize_forecasts_fast(forecasts)
+            
+            # Build response in the ForecastSummarySerializer shape
+            return {
+                'place_id': place_id,
+                'place_name': place.title,
+                'item_id': None,
+                'item_name': None,
+                'forecast_count': len(forecast_rows),
+                'date_range': dict(DateRangeSerializer({
+                    'start': start_date,
+                    'end': end_date
+                }).data),
+                'metrics': dict(ForecastMetricsSerializer(forecast_model).data),
+                'forecasts': forecast_rows
+            }
         
-        serializer = ForecastSummarySerializer(response_data)
-        return Response(serializer.data)
+        # Saved forecasts never change, so the response data is reused
+        return cached_response(forecast_cache_key(forecast_model, days, include_history), build)
 
 
 class ForecastItemView(APIView):
@@ -114,20 +186,21 @@ class ForecastItemView(APIView):
     Returns forecasts anchored to the model's training date.
     """
     
+    @method_decorator(cache_control(max_age=300, private=True))
+    @method_decorator(vary_on_headers('Accept'))
+    @method_decorator(etag(forecast_etag))
     def get(self, request, place_id, item_id):
+        query_serializer = ForecastQuerySerializer(data=request.query_params)
+        if not query_serializer.is_valid():
+            return Response(query_serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+        days = query_serializer.validated_data['days']
+        
         place = get_object_or_404(Place, pk=place_id)
         item = get_object_or_404(Item, pk=item_id)
         
-        days = int(request.query_params.get('days', 7))
-        
         # Get active forecast model for this item
-        forecast_model = ForecastModel.objects.filter(
-            place=place,
-            item=item,
-            is_active=True
-        ).order_by('-training_date').first()
-        
-        if not forecast_model:
+        forecast_model = active_forecast_model(place.pk, item.pk)
+        if forecast_model is None:
             error_data = {
                 'status': 'no_forecast',
                 'message': f'No forecast available for {item.title} at {place.title}',
@@ -143,33 +216,31 @@ class ForecastItemView(APIView):
         start_date = anchor_date
         end_date = anchor_date + timedelta(days=days)
         
-        forecasts = DemandForecast.objects.filter(
-            forecast_model=forecast_model,
-            forecast_date__gte=start_date,
-            forecast_date__lte=end_date
-        ).order_by('forecast_date')
-        
-        response_data = {
-            'place_id': place_id,
-            'place_name': place.title,
-            'item_id': item_id,
-            'item_name': item.title,
-            'forecast_count': forecasts.count(),
-            'date_range': {
-                'start': start_date,
-                'end': end_date
-            },
-            'metrics': {
-                'mape': forecast_model.mape,
-                'rmse': forecast_model.rmse,
-                'mae': forecast_model.mae,
-                'training_date': forecast_model.training_date
-            },
-            'forecasts': forecasts
-        }
+        def build():
+            forecasts = DemandForecast.objects.filter(
+                forecast_model=forecast_model,
+                forecast_date__gte=start_date,
+                forecast_date__lte=end_date
+            ).order_by('forecast_date')
+            forecast_rows = serialize_forecasts_fast(forecasts)
+            
+            # Build response in the ForecastSummarySerializer shape
+            return {
+                'place_id': place_id,
+                'place_name': place.title,
+                'item_id': item_id,
+                'item_name': item.title,
+                'forecast_count': len(forecast_rows),
+                'date_range': dict(DateRangeSerializer({
+                    'start': start_date,
+                    'end': end_date
+                }).data),
+                'metrics': dict(ForecastMetricsSerializer(forecast_model).data),
+                'forecasts': forecast_rows
+            }
         
-        serializer = ForecastSummarySerializer(response_data)
-        return Response(serializer.data)
+        # Saved forecasts never change, so the response data is reused
+        return cached_response(forecast_cache_key(forecast_model, days), build)
 
 
 class GenerateForecastView(APIView):
@@ -196,12 +267,23 @@ class GenerateForecastView(APIView):
         days_ahead = request_serializer.validated_data.get('days_ahead', 7)
         item_ids = request_serializer.validated_data.get('item_ids', None)
         
+        # With a Celery broker configured, train off the request thread
+        if tasks_enabled():
+            task = generate_forecasts_task.delay(place_id, days_ahead, item_ids)
+            return Response({
+                'status': 'queued',
+                'task_id': task.id,
+                'place_id': place_id
+            }, status=status.HTTP_202_ACCEPTED)
+        
         # Generate forecasts
-        result = generate_forecasts_for_place(
-            place_id=place_id,
-            days_ahead=days_ahead,
-            item_ids=item_ids
-        )
+        result = run_forecast_generation(place_id, days_ahead, item_ids)
+        if result is None:
+            return Response({
+                'status': 'already_running',
+                'message': f'Forecasts for place {place_id} are already being generated',
+                'place_id': place_id
+            }, status=status.HTTP_202_ACCEPTED)
         
         if 'error' in result:
             error_data = {
@@ -253,17 +335,14 @@ class ForecastModelsListView(APIView):
         if place_id:
             queryset = queryset.filter(place_id=place_id)
         
-        queryset = queryset.order_by('-training_date')[:50]
-        
-        models_serializer = ForecastModelSerializer(queryset, many=True)
+        # Reads only the listed columns, with place and item titles joined in
+        forecast_models = serialize_forecast_models_fast(queryset.order_by('-training_date')[:50])
         
-        response_data = {
-            'count': len(models_serializer.data),
-            'models': queryset
-        }
-        
-        serializer = ForecastModelsListSerializer(response_data)
-        return Response(serializer.data)
+        # Build response in the ForecastModelsListSerializer shape
+        return Response({
+            'count': len(forecast_models),
+            'models': forecast_models
+        })
 
 
 class ForecastDashboardView(TemplateView):
@@ -278,12 +357,18 @@ class ForecastDashboardView(TemplateView):
         
         context = super().get_context_data(**kwargs)
         
-        # Get places with at least one order, sorted by activity
-        places_with_orders = Place.objects.annotate(
-            order_count=Count('orders')
-        ).filter(order_count__gt=0).order_by('-order_count')[:20]
-        
-        context['places'] = places_with_orders
+        # Get places with at least one order, sorted by activity. Only the
+        # selector's fields are kept, cached briefly as counts drift slowly
+        def places_with_orders():
+            return list(Place.objects.annotate(
+                order_count=Count('orders')
+            ).filter(order_count__gt=0).order_by('-order_count').values(
+                'id', 'title', 'order_count'
+            )[:20])
+        
+        context['places'] = cache.get_or_set(
+            DASHBOARD_PLACES_CACHE_KEY, places_with_orders, DASHBOARD_CACHE_TIMEOUT
+        )
         context['recent_models'] = ForecastModel.objects.filter(
             is_active=True
         ).order_by('-training_date')[:5]
@@ -298,23 +383,31 @@ class AvailablePlacesView(APIView):
     """
     
     def get(self, request):
-        # We now query directly from the database instead of CSV files
-        db_places = list(Place.objects.filter(active=True).values('id', 'title')[:50])
-        
-        enriched_places = []
-        for place in db_places:
-            # We could add order counts here if needed, but for now just returning available places
-            enriched_places.append({
-                'place_id': place['id'],
-                'place_name': place['title'],
-                'order_count': 0, # Placeholder, calculation is expensive
+        return cached_response(AVAILABLE_PLACES_CACHE_KEY, self.build)
+    
+    @staticmethod
+    def build():
+        from django.db.models import Count
+        
+        # Order counts come from the same query as one GROUP BY
+        db_places = Place.objects.filter(active=True).annotate(
+            order_count=Count('orders')
+        ).values_list('id', 'title', 'order_count')[:50]
+        
+        enriched_places = [
+            {
+                'place_id': place_id,
+                'place_name': title,
+                'order_count': order_count,
                 'has_csv_data': True # Legacy field for compatibility
-            })
+            }
+            for place_id, title, order_count in db_places
+        ]
         
-        return Response({
+        return {
             'count': len(enriched_places),
             'places': enriched_places
-        })
+        }
 
 class PlaceItemsView(APIView):
     """
@@ -327,14 +420,18 @@ class PlaceItemsView(APIView):
     """
     
     def get(self, request, place_id):
+        return cached_response(place_items_cache_key(place_id), lambda: self.build(place_id))
+    
+    @staticmethod
+    def build(place_id):
         from django.db.models import Sum, Count
-        from apps.sales.models import OrderItem
+        from apps.sales.models import Order, OrderItem
         from apps.inventory.models import Item
         
         # Get items that have been ordered at this place with order counts
         items_with_orders = OrderItem.objects.filter(
             order__place_id=place_id,
-            order__status__icontains='Closed',
+            order__status=Order.CLOSED,
             item__isnull=False
         ).values(
             'item_id',
@@ -353,10 +450,10 @@ class PlaceItemsView(APIView):
                 'total_quantity': float(item['total_quantity'] or 0)
             })
         
-        return Response({
+        return {
             'place_id': place_id,
             'count': len(items),
             'items': items
-        })
+        }
 
 
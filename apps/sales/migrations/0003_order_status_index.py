@@ -0,0 +1,25 @@
+# Generated by Django 5.2.18 on 2026-10-15 01:56
+
+from django.db import migrations, models
+
+
+def canonicalize_closed_status(apps, schema_editor):
+    # Forecasting now matches status='Closed' exactly; fold other casings into it
+    Order = apps.get_model('sales', 'Order')
+    Order.objects.filter(status__iexact='closed').exclude(status='Closed').update(status='Closed')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('sales', '0002_bonuscode_cashbalance_invoiceitem_mostorderedstat'),
+    ]
+
+    operations = [
+        migrations.RunPython(canonicalize_closed_status, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='order',
+            name='status',
+            field=models.CharField(db_index=True, default='Pending', max_length=50),
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 5.2.18 on 2026-10-15 02:05
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0001_initial'),
+        ('sales', '0003_order_status_index'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='order',
+            index=models.Index(fields=['place', 'status', 'created_at'], name='sales_order_place_i_5d5ed3_idx'),
+        ),
+    ]
@@ -13,10 +13,13 @@ class Campaign(models.Model):
         return self.title
 
 class Order(models.Model):
+    # Status of a completed sale; the only one sales history reads
+    CLOSED = 'Closed'
+
     place = models.ForeignKey(Place, on_delete=models.CASCADE, related_name='orders')
     user = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, blank=True, related_name='orders')
     
-    status = models.CharField(max_length=50, default='Pending')
+    status = models.CharField(max_length=50, default='Pending', db_index=True)
     total_amount = models.DecimalField(max_digits=12, decimal_places=2, default=0)
     payment_method = models.CharField(max_length=50, blank=True)
     
@@ -25,6 +28,12 @@ class Order(models.Model):
     
     external_id = models.CharField(max_length=100, unique=True, null=True, blank=True)
 
+    class Meta:
+        indexes = [
+            # Sales history for a place: status filter plus created_at range/grouping
+            models.Index(fields=['place', 'status', 'created_at']),
+        ]
+
     def __str__(self):
         return f"Order {self.external_id or self.id} - {self.total_amount}"
 
@@ -0,0 +1,18 @@
+"""
+Celery application for background forecast generation (optional).
+
+Only set up when Celery is installed; configured from the CELERY_*
+Django settings.
+"""
+
+import os
+
+try:
+    from celery import Celery
+except ImportError:
+    app = None
+else:
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
+    app = Celery('config')
+    app.config_from_object('django.conf:settings', namespace='CELERY')
+    app.autodiscover_tasks()
@@ -1,3 +1,4 @@
+import os
 from pathlib import Path
 
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -87,3 +88,31 @@ REST_FRAMEWORK = {
     ],
 }
 
+# Shared cache. The intelligence views cache responses and drop them from
+# signals and on_commit hooks, so every process must see the same cache:
+# the per-process default (LocMemCache) would keep serving stale forecasts.
+# The database backend needs `python manage.py createcachetable`
+if os.environ.get('REDIS_URL'):
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': os.environ['REDIS_URL'],
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.db.DatabaseCache',
+            'LOCATION': 'django_cache',
+        }
+    }
+
+# Celery (optional): forecast generation is queued only when a broker is set
+CELERY_BROKER_URL = os.environ.get('CELERY_BROKER_URL')
+CELERY_RESULT_BACKEND = os.environ.get('CELERY_RESULT_BACKEND')
+
+# Last fitted Prophet model per place/item, used to warm-start refits.
+# Must be writable; kept outside the application package
+FORECAST_MODEL_CACHE_DIR = os.environ.get(
+    'FORECAST_MODEL_CACHE_DIR', str(BASE_DIR / 'var' / 'prophet_cache')
+)